@@ -1,11 +1,15 @@
 require('dotenv').config();
 
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
 const express = require('express');
 const http = require('http');
 const socketIo = require('socket.io');
 const cors = require('cors');
 
 const RedisService = require('./src/services/RedisService');
+const Question = require('./src/models/Question');
 
 let questionsData;
 try {
@@ -16,6 +20,21 @@ try {
   process.exit(1);
 }
 
+try {
+  const answerAliases = require('./src/data/questions.aliases.json');
+  // Same digest as hintbank.bank.file_digest, truncated like the artifact's source
+  const catalog = fs.readFileSync(path.join(__dirname, 'src/data/questions.json'));
+  const source = crypto.createHash('sha256').update(catalog).digest('hex').slice(0, 16);
+  if (Question.setAliasIndex(answerAliases, source)) {
+    console.log('✅ Answer aliases loaded:', Object.keys(answerAliases.aliases).length);
+  } else {
+    console.warn('⚠️ Answer aliases were built for another catalog, using full matching only; '
+      + 'run `python3 -m hintbank.aliases backend`');
+  }
+} catch (error) {
+  console.warn('⚠️ Answer aliases unavailable, using full matching only:', error.message);
+}
+
 const GameManager = require('./src/services/GameManager');
 
 const app = express();
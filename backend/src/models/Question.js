@@ -63,9 +63,15 @@ class Question {
         .replace(/\s+/g, ' ');
     };
 
-    const normalizedAnswer = normalizeText(this.answer);
     const normalizedUserAnswer = normalizeText(userAnswer);
 
+    // Precomputed aliases accept most correct guesses with a single lookup
+    if (this.matchesAlias(normalizedUserAnswer)) {
+      return true;
+    }
+
+    const normalizedAnswer = normalizeText(this.answer);
+
     // Exact match
     if (normalizedAnswer === normalizedUserAnswer) {
       return true;
@@ -99,6 +105,25 @@ class Question {
     return false;
   }
 
+  matchesAlias(normalizedGuess) {
+    const ids = Question.aliasIndex && Question.aliasIndex.get(normalizedGuess);
+    if (!ids) {
+      return false;
+    }
+    return Array.isArray(ids) ? ids.includes(this.id) : ids === this.id;
+  }
+
+  static setAliasIndex(index, catalogSource) {
+    // Generated by `python3 -m hintbank.aliases`; see README "Question content".
+    // An index built for another catalog would map guesses to the wrong ids
+    if (index && catalogSource !== undefined && index.source !== catalogSource) {
+      Question.aliasIndex = null;
+      return false;
+    }
+    Question.aliasIndex = index && index.aliases ? new Map(Object.entries(index.aliases)) : null;
+    return Question.aliasIndex !== null;
+  }
+
   getElapsedTime() {
     if (this.startTime) {
       return Date.now() - this.startTime;
@@ -111,4 +136,6 @@ class Question {
   }
 }
 
+Question.aliasIndex = null;
+
 module.exports = Question;
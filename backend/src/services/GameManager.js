@@ -1,5 +1,6 @@
 const GameRoom = require('../models/GameRoom');
 const SurvivalRoom = require('../models/SurvivalRoom');
+const crypto = require('crypto');
 const { v4: uuidv4 } = require('uuid');
 
 class GameManager {
@@ -7,6 +8,10 @@ class GameManager {
     this.gameRooms = new Map();
     this.survivalRooms = new Map();
     this.questionsData = questionsData;
+    // Same hash as `python3 -m hintbank.versions`, so snapshots can store ids only
+    this.bankVersion = crypto.createHash('sha256')
+      .update(JSON.stringify(questionsData, null, 2))
+      .digest('hex');
     this.connectedPlayers = new Map();
     this.disconnectedPlayers = new Map();
     this.redisService = redisService;
@@ -55,7 +60,8 @@ class GameManager {
         gameMode: p.gameMode,
         personalCategory: p.personalCategory
       })),
-      questions: room.questions,
+      questionIds: room.questions.map(q => q.id),
+      bankVersion: this.bankVersion,
       health: room.health,
       playerCategories: room.playerCategories,
       categoryMix: room.categoryMix
@@ -84,7 +90,8 @@ class GameManager {
         gameMode: p.gameMode,
         personalCategory: p.personalCategory
       })),
-      questions: room.questions,
+      questionIds: room.questions.map(q => q.id),
+      bankVersion: this.bankVersion,
       health: room.health,
       readyPlayers: Array.from(room.readyPlayers || []),
       eliminatedPlayers: Array.from(room.eliminatedPlayers || [])
@@ -60,6 +60,14 @@ class RedisService {
 
   // ===== ROOM OPERATIONS =====
 
+  parseQuestionIds(data) {
+    // Older snapshots embedded the full questions instead of ids
+    if (data.questionIds) {
+      return JSON.parse(data.questionIds);
+    }
+    return JSON.parse(data.questions || '[]').map(question => question.id);
+  }
+
   async saveRoom(roomId, roomData) {
     try {
       const key = `room:${roomId}`;
@@ -73,7 +81,8 @@ class RedisService {
         questionAnswered: roomData.questionAnswered.toString(),
         createdAt: roomData.createdAt.toString(),
         players: JSON.stringify(roomData.players),
-        questions: JSON.stringify(roomData.questions),
+        questionIds: JSON.stringify(roomData.questionIds),
+        bankVersion: roomData.bankVersion,
         health: JSON.stringify(roomData.health),
         playerCategories: JSON.stringify(roomData.playerCategories || []),
         categoryMix: JSON.stringify(roomData.categoryMix || [])
@@ -106,7 +115,8 @@ class RedisService {
         questionAnswered: data.questionAnswered === 'true',
         createdAt: parseInt(data.createdAt),
         players: JSON.parse(data.players),
-        questions: JSON.parse(data.questions),
+        questionIds: this.parseQuestionIds(data),
+        bankVersion: data.bankVersion || null,
         health: JSON.parse(data.health),
         playerCategories: JSON.parse(data.playerCategories || '[]'),
         categoryMix: JSON.parse(data.categoryMix || '[]')
@@ -154,7 +164,8 @@ class RedisService {
         questionAnswered: roomData.questionAnswered.toString(),
         createdAt: roomData.createdAt.toString(),
         players: JSON.stringify(roomData.players),
-        questions: JSON.stringify(roomData.questions),
+        questionIds: JSON.stringify(roomData.questionIds),
+        bankVersion: roomData.bankVersion,
         health: JSON.stringify(roomData.health),
         readyPlayers: JSON.stringify(Array.from(roomData.readyPlayers || [])),
         eliminatedPlayers: JSON.stringify(Array.from(roomData.eliminatedPlayers || []))
@@ -188,7 +199,8 @@ class RedisService {
         questionAnswered: data.questionAnswered === 'true',
         createdAt: parseInt(data.createdAt),
         players: JSON.parse(data.players),
-        questions: JSON.parse(data.questions),
+        questionIds: this.parseQuestionIds(data),
+        bankVersion: data.bankVersion || null,
         health: JSON.parse(data.health),
         readyPlayers: new Set(JSON.parse(data.readyPlayers || '[]')),
         eliminatedPlayers: new Set(JSON.parse(data.eliminatedPlayers || '[]'))
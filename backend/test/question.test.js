@@ -0,0 +1,39 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+
+const Question = require('../src/models/Question');
+
+test.afterEach(() => {
+  Question.setAliasIndex(null);
+});
+
+test('alias index accepts listed guesses only for their own question', () => {
+  Question.setAliasIndex({ version: 1, aliases: { 'schrodingers cat': 'q7', curie: ['q8', 'q9'] } });
+
+  const cat = new Question('q7', "Schrödinger's Cat", 'Physics', 'hard');
+  const curie = new Question('q9', 'Marie Curie', 'Science', 'medium');
+  const other = new Question('q10', 'Pierre Curie', 'Science', 'hard');
+
+  assert.equal(cat.checkAnswer("Schrodinger's cat"), true);
+  assert.equal(curie.checkAnswer('Curie'), true);
+  assert.equal(other.checkAnswer('Curie'), false);
+});
+
+test('alias index built for another catalog is dropped', () => {
+  const index = { version: 1, source: 'aaaaaaaaaaaaaaaa', aliases: { curie: 'q9' } };
+  const curie = new Question('q9', 'Pierre Curie', 'Science', 'hard');
+
+  assert.equal(Question.setAliasIndex(index, 'bbbbbbbbbbbbbbbb'), false);
+  assert.equal(curie.checkAnswer('Curie'), false);
+  assert.equal(Question.setAliasIndex(index, 'aaaaaaaaaaaaaaaa'), true);
+  assert.equal(curie.checkAnswer('Curie'), true);
+});
+
+test('alias misses fall back to full matching', () => {
+  Question.setAliasIndex({ version: 1, aliases: {} });
+
+  const question = new Question('q1', "Newton's First Law", 'Physics', 'medium');
+
+  assert.equal(question.checkAnswer('newtons first law'), true);
+  assert.equal(question.checkAnswer('gravity'), false);
+});
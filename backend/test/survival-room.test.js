@@ -154,3 +154,28 @@ test('GameManager reconnection does not duplicate socket handlers', async () =>
   room.cleanup();
   await manager.shutdown();
 });
+
+test('GameManager survival snapshots reference questions by id and bank version', async () => {
+  const savedRooms = [];
+  const redisService = {
+    saveSurvivalRoom: async (roomId, roomData) => {
+      savedRooms.push(roomData);
+      return true;
+    }
+  };
+  const manager = new GameManager(QUESTIONS, redisService);
+
+  const room = new SurvivalRoom('SURVIVAL-SNAPSHOT', QUESTIONS);
+  room.addPlayer(new FakeSocket('socket-a'), 'Alice');
+  room.addPlayer(new FakeSocket('socket-b'), 'Bob');
+
+  await manager.saveSurvivalRoomToRedis(room);
+
+  assert.deepEqual(savedRooms[0].questionIds, [1]);
+  assert.equal(savedRooms[0].questions, undefined);
+  assert.equal(savedRooms[0].bankVersion, manager.bankVersion);
+  assert.match(manager.bankVersion, /^[0-9a-f]{64}$/);
+
+  room.cleanup();
+  await manager.shutdown();
+});
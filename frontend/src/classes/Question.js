@@ -1,3 +1,14 @@
+import answerAliases from '../data/questions.aliases.json';
+
+// Generated by `python3 -m hintbank.aliases`; keys use normalizeAnswer(). Its
+// source digest is checked against questions.json by hintbank/tests/test_artifacts.py
+const aliasIndex = new Map(Object.entries(answerAliases.aliases));
+
+// Mirrors hintbank.matching.fold_accents: "Schrödinger’s" -> "Schrodinger's"
+export function foldAccents(text) {
+  return text.replace(/[’‘]/g, "'").normalize('NFKD').replace(/\p{Mn}/gu, '');
+}
+
 export class Question {
   constructor(id, correctAnswer, category, difficulty) {
     this.id = id;
@@ -36,6 +47,12 @@ export class Question {
   checkAnswer(guess) {
     // Normalize both the guess and the correct answer
     const normalizedGuess = this.normalizeAnswer(guess);
+
+    // Precomputed aliases accept most correct guesses with a single lookup
+    if (this.matchesAlias(normalizedGuess)) {
+      return true;
+    }
+
     const normalizedAnswer = this.normalizeAnswer(this.correctAnswer);
 
     // Check for exact match first
@@ -102,6 +119,14 @@ export class Question {
     return isCorrect;
   }
 
+  matchesAlias(normalizedGuess) {
+    const ids = aliasIndex.get(normalizedGuess);
+    if (!ids) {
+      return false;
+    }
+    return Array.isArray(ids) ? ids.includes(this.id) : ids === this.id;
+  }
+
   normalizeAnswer(text) {
     return text
       .toLowerCase()
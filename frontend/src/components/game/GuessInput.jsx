@@ -5,11 +5,13 @@ const GuessInput = ({
   onSubmit,
   disabled = false,
   placeholder = "Enter your deduction...",
-  className = ''
+  className = '',
+  suggest = null
 }) => {
   const [guess, setGuess] = useState('');
   const [isSubmitting, setIsSubmitting] = useState(false);
   const inputRef = useRef(null);
+  const suggestions = suggest && guess.trim() ? suggest(guess) : [];
 
   useEffect(() => {
     if (!disabled && inputRef.current) {
@@ -64,7 +66,15 @@ const GuessInput = ({
             className="flex-1 p-3 border border-hitman-gray rounded-lg focus:outline-none focus:ring-2 focus:ring-hitman-red focus:border-transparent disabled:bg-gray-100 disabled:cursor-not-allowed"
             maxLength={100}
             autoComplete="off"
+            list={suggest ? 'guess-suggestions' : undefined}
           />
+          {suggest && (
+            <datalist id="guess-suggestions">
+              {suggestions.map((answer) => (
+                <option key={answer} value={answer} />
+              ))}
+            </datalist>
+          )}
 
           <Button
             type="submit"
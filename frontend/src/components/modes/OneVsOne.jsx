@@ -2,6 +2,10 @@ import React, { useEffect, useRef, useState } from 'react';
 import { Player } from '../../classes/Player.js';
 import { Question } from '../../classes/Question.js';
 import questionsData from '../../data/questions.json';
+import answerTrieData from '../../data/questions.trie.json';
+import samplingTables from '../../data/questions.sampling.json';
+import { AnswerTrie } from '../../services/AnswerTrie.js';
+import { QuestionSampler } from '../../services/QuestionSampler.js';
 import HintDisplay from '../game/HintDisplay';
 import GuessInput from '../game/GuessInput';
 import Timer from '../common/Timer';
@@ -37,6 +41,15 @@ const aiGuessChance = (hintCount) => {
   }
 };
 
+const answerTrie = new AnswerTrie(answerTrieData);
+const suggestAnswers = (text) => answerTrie.complete(text);
+
+const questionsById = new Map(questionsData.map(q => [q.id, q]));
+
+const secureRandom = () => (window.crypto && window.crypto.getRandomValues
+  ? window.crypto.getRandomValues(new Uint32Array(1))[0] / (0xFFFFFFFF + 1)
+  : Math.random());
+
 export default function OneVsOne({ playerName, onBackToMenu }) {
   // Core game state
   const [phase, setPhase] = useState('setup');
@@ -53,7 +66,7 @@ export default function OneVsOne({ playerName, onBackToMenu }) {
   const processingRef = useRef(false);
   const hintTimerRef = useRef(null);
   const questionIdRef = useRef(0);
-  const usedQuestionsRef = useRef(new Set());
+  const samplerRef = useRef(null);
 
   // Main game loop driver: mounts a new question when qIndex changes
   useEffect(() => {
@@ -77,75 +90,39 @@ export default function OneVsOne({ playerName, onBackToMenu }) {
 
   const isAlive = (p) => !!p && (p.health ?? 0) > 0;
 
-  // Enhanced deck building with better randomization and avoiding recently used questions
+  // Draw a deck from the weighted category/difficulty tables, skipping recently used questions
   const buildDeck = () => {
-    // If we've used more than 80% of questions, reset the used questions set
-    if (usedQuestionsRef.current.size > questionsData.length * 0.8) {
-      usedQuestionsRef.current.clear();
-    }
-
-    // Filter out recently used questions
-    const availableQuestions = questionsData.filter(q => !usedQuestionsRef.current.has(q.id));
+    const sampler = getSampler();
 
-    // If we don't have enough unused questions, use all questions
-    const questionPool = availableQuestions.length >= MAX_TARGETS ? availableQuestions : [...questionsData];
-
-    // Enhanced Fisher-Yates shuffle for better randomization
-    const shuffled = [...questionPool];
-    for (let i = shuffled.length - 1; i > 0; i--) {
-      const randomValue = window.crypto && window.crypto.getRandomValues
-        ? window.crypto.getRandomValues(new Uint32Array(1))[0] / (0xFFFFFFFF + 1)
-        : Math.random();
-
-      const j = Math.floor(randomValue * (i + 1));
-      [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
+    // If we've used more than 80% of questions, start over
+    if (sampler.used > questionsData.length * 0.8) {
+      sampler.reset();
     }
 
-    // Select questions ensuring variety across categories and difficulties
-    const selectedQuestions = selectDiverseQuestions(shuffled, MAX_TARGETS);
+    const selectedQuestions = [];
+    for (let attempt = 0; selectedQuestions.length < MAX_TARGETS && attempt < questionsData.length; attempt++) {
+      const id = sampler.draw();
+      if (id === null) {
+        // Everything has been used: start over, keeping this deck's picks out
+        sampler.reset();
+        selectedQuestions.forEach(q => sampler.markUsed(q.id));
+        continue;
+      }
 
-    // Mark these questions as used
-    selectedQuestions.forEach(q => usedQuestionsRef.current.add(q.id));
+      // Mark the question as used so later draws and decks skip it
+      sampler.markUsed(id);
+      const question = questionsById.get(id);
+      if (question) selectedQuestions.push(question);
+    }
 
     deckRef.current = selectedQuestions;
   };
 
-  // Select questions with better category and difficulty distribution
-  const selectDiverseQuestions = (shuffledQuestions, count) => {
-    const selected = [];
-    const usedCategories = new Set();
-    const usedDifficulties = new Set();
-
-    // First pass: Try to get diverse categories and difficulties
-    for (const question of shuffledQuestions) {
-      if (selected.length >= count) break;
-
-      const categoryCount = Array.from(usedCategories).filter(cat => cat === question.category).length;
-      const difficultyCount = Array.from(usedDifficulties).filter(diff => diff === question.difficulty).length;
-
-      // Prefer questions from less used categories and difficulties
-      if (categoryCount < Math.ceil(count / 3) && difficultyCount < Math.ceil(count / 2)) {
-        selected.push(question);
-        usedCategories.add(question.category);
-        usedDifficulties.add(question.difficulty);
-      }
+  const getSampler = () => {
+    if (!samplerRef.current) {
+      samplerRef.current = new QuestionSampler(samplingTables, secureRandom);
     }
-
-    // Second pass: Fill remaining slots with any available questions
-    for (const question of shuffledQuestions) {
-      if (selected.length >= count) break;
-      if (!selected.includes(question)) {
-        selected.push(question);
-      }
-    }
-
-    // Final shuffle of selected questions
-    for (let i = selected.length - 1; i > 0; i--) {
-      const j = Math.floor(Math.random() * (i + 1));
-      [selected[i], selected[j]] = [selected[j], selected[i]];
-    }
-
-    return selected;
+    return samplerRef.current;
   };
 
   // Set up a new question and its timers
@@ -560,6 +537,7 @@ export default function OneVsOne({ playerName, onBackToMenu }) {
               onSubmit={onGuess}
               disabled={isInputDisabled}
               placeholder="Take your shot (be precise)..."
+              suggest={suggestAnswers}
               key={`input-${qIndex}`}
             />
           </div>
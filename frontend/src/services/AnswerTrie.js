@@ -0,0 +1,104 @@
+import { Question, foldAccents } from '../classes/Question.js';
+
+// Layout written by `python3 -m hintbank.trie`; see hintbank/trie.py
+const NODE_FIELDS = 5;
+
+// normalizeAnswer() drops these only once another word follows
+const LEADING_WORDS = ['the', 'a', 'an'];
+const INNER_WORDS = [...LEADING_WORDS, 'of', 'in', 'on', 'at', 'by', 'for', 'with'];
+const pendingWords = words => (words.length === 1 ? LEADING_WORDS : INNER_WORDS);
+
+export class AnswerTrie {
+  constructor(data) {
+    this.labels = data.labels;
+    this.nodes = Int32Array.from(data.nodes);
+    this.answers = data.answers;
+  }
+
+  normalize(text) {
+    // Keys are accent-folded before the local matcher's normalization
+    return Question.prototype.normalizeAnswer(foldAccents(text));
+  }
+
+  // Keys to complete partial input from, most specific first; mirrors
+  // hintbank.trie.prefix_keys. Trailing articles and prepositions are held
+  // back, and a word that may be the start of one is tried both ways
+  keys(text) {
+    const folded = foldAccents(text);
+    const words = folded.split(/\s+/).filter(Boolean);
+    let keys = [this.normalize(folded)];
+    if (words.length > 0) {
+      const partial = /\s$/.test(folded) ? null : words.pop();
+      while (words.length > 0 && pendingWords(words).includes(words[words.length - 1].toLowerCase())) {
+        words.pop();
+      }
+      keys = [this.normalize(words.join(' '))];
+      if (partial !== null) {
+        const lower = partial.toLowerCase();
+        if (!pendingWords([...words, partial]).some(word => word.startsWith(lower))) {
+          keys = [];
+        }
+        keys.unshift(this.normalize(folded));
+      }
+    }
+    return keys.filter((key, index) => key && keys.indexOf(key) === index);
+  }
+
+  find(prefix) {
+    let node = 0;
+    let rest = prefix;
+
+    while (rest.length > 0) {
+      const base = node * NODE_FIELDS;
+      const first = this.nodes[base + 2];
+      const last = first + this.nodes[base + 3];
+      let next = -1;
+
+      for (let child = first; child < last; child++) {
+        const start = this.nodes[child * NODE_FIELDS];
+        if (this.labels[start] !== rest[0]) continue;
+
+        const label = this.labels.substr(start, this.nodes[child * NODE_FIELDS + 1]);
+        if (label.startsWith(rest)) return child;
+        if (!rest.startsWith(label)) return -1;
+
+        rest = rest.slice(label.length);
+        next = child;
+        break;
+      }
+
+      if (next === -1) return -1;
+      node = next;
+    }
+
+    return node;
+  }
+
+  hasPrefix(text) {
+    return this.keys(text).some(key => this.find(key) !== -1);
+  }
+
+  complete(text, limit = 5) {
+    const results = [];
+    for (const key of this.keys(text)) {
+      const node = this.find(key);
+      if (node === -1) continue;
+
+      const stack = [node];
+      while (stack.length > 0 && results.length < limit) {
+        const current = stack.pop();
+        const base = current * NODE_FIELDS;
+        const answer = this.nodes[base + 4] >= 0 ? this.answers[this.nodes[base + 4]] : null;
+        if (answer !== null && !results.includes(answer)) {
+          results.push(answer);
+        }
+        for (let child = this.nodes[base + 2] + this.nodes[base + 3] - 1; child >= this.nodes[base + 2]; child--) {
+          stack.push(child);
+        }
+      }
+    }
+    return results;
+  }
+}
+
+export default AnswerTrie;
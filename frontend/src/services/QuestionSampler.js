@@ -0,0 +1,67 @@
+// Tables written by `python3 -m hintbank.sampling`; see hintbank/sampling.py
+const MAX_REJECTS = 64;
+
+export class QuestionSampler {
+  constructor(data, random = Math.random) {
+    this.strata = data.strata;
+    this.tables = data.tables;
+    this.random = random;
+    this.reset();
+  }
+
+  reset() {
+    this.pools = this.strata.map(stratum => [...stratum.ids]);
+    this.where = new Map();
+    this.pools.forEach((pool, index) => {
+      pool.forEach((id, position) => this.where.set(id, [index, position]));
+    });
+    this.used = 0;
+  }
+
+  // Swap-remove the question from its stratum so it is not drawn again
+  markUsed(id) {
+    const entry = this.where.get(id);
+    if (!entry) return false;
+
+    const [index, position] = entry;
+    const pool = this.pools[index];
+    const last = pool.pop();
+    if (last !== id) {
+      pool[position] = last;
+      this.where.set(last, [index, position]);
+    }
+    this.where.delete(id);
+    this.used++;
+    return true;
+  }
+
+  remaining(category = '') {
+    return this.tables[category].strata.reduce((sum, index) => sum + this.pools[index].length, 0);
+  }
+
+  // Id of an unused question, or null when the table has none left
+  draw(category = '') {
+    const table = this.tables[category];
+    if (!table) return null;
+
+    let rejects = 0;
+    while (true) {
+      let column = Math.floor(this.random() * table.prob.length);
+      if (this.random() >= table.prob[column]) {
+        column = table.alias[column];
+      }
+      const index = table.strata[column];
+
+      // Accept a stratum in proportion to how much of it is still unused
+      const pool = this.pools[index];
+      if (pool.length > 0 && this.random() * this.strata[index].ids.length < pool.length) {
+        return pool[Math.floor(this.random() * pool.length)];
+      }
+
+      if (++rejects >= MAX_REJECTS) {
+        if (this.remaining(category) === 0) return null;
+        rejects = 0;
+      }
+    }
+  }
+}
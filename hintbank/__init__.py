@@ -0,0 +1,5 @@
+"""Offline tooling for the HINTMAN question banks.
+
+Each module is a small command that reads one of the JSON catalogs and
+writes an artifact next to it, e.g. ``python3 -m hintbank.aliases``.
+"""
@@ -0,0 +1,185 @@
+"""Build the answer alias index used as a fast path by the answer matchers.
+
+For every question we precompute the normalized guesses that should be
+accepted (the answer itself, article-free and accent-folded forms, surnames
+for people, and common typos the matcher already tolerates). The result is
+an ``alias -> id`` map written next to the bank as ``questions.aliases.json``;
+``Question.checkAnswer`` only runs the full comparison on a lookup miss.
+"""
+
+import argparse
+import re
+
+from .bank import BANKS, artifact_path, file_digest, load_bank, question_digest, write_artifact
+from .matching import FRONTEND_COMMON_WORDS, MATCHERS, fold_accents
+from .memo import MemoCache
+
+INDEX_VERSION = 1
+
+# Cached alias sets are only valid for the rules in this file that built them
+RULES_VERSION = file_digest(__file__)[:16]
+
+_ARTICLE = re.compile(r'^(the|a|an)\s+', re.IGNORECASE)
+_PRONOUN = re.compile(r'\b(he|she|his|her|born|died)\b', re.IGNORECASE)
+# Opening words of a first hint that describes a person: "This Dutch painter"
+_PERSON_ROLE = re.compile(
+    r"^(?:this\s+)?(?:[\w'.-]+\s+){0,3}(artist|author|writer|novelist|poet|"
+    r"playwright|painter|sculptor|scientist|naturalist|physicist|chemist|inventor|"
+    r"explorer|composer|singer|songwriter|musician|guitarist|entertainer|humorist|"
+    r"director|actor|actress|player|golfer|sprinter|swimmer|gymnast|boxer|"
+    r"quarterback|general|leader|minister|president|emperor)\b",
+    re.IGNORECASE,
+)
+# "This Van Gogh painting ...", "This novel was written by ..."
+_WORK_HINT = re.compile(
+    r"^(this\s+(?:[\w'.-]+\s+){0,3}(painting|fresco|sculpture|portrait|novel|book|"
+    r"poem|play|opera|film|movie|show|sitcom|series|song|album|ship|dynasty|holiday|"
+    r"movement|phenomenon|theory|battle|war|event)\b|painted|features|pioneered|named)",
+    re.IGNORECASE,
+)
+_NAME_WORD = re.compile(r'^[A-Z][a-z]+\.?$')
+_LOWER_WORD = re.compile(r'\b[a-z]+\b')
+NAME_PARTICLES = frozenset(['da', 'de', 'del', 'der', 'di', 'du', 'la', 'le', 'van', 'von'])
+NAME_SUFFIXES = frozenset(['Jr.', 'Sr.', 'Jr', 'Sr'])
+
+# Shorter aliases are too easy to hit by accident
+MIN_ALIAS_LENGTH = 3
+
+
+def looks_like_person(question):
+    answer = question['answer']
+    words = fold_accents(answer).split()
+    if not 2 <= len(words) <= 4 or _ARTICLE.match(answer):
+        return False
+    if not all(_NAME_WORD.match(w) or w in NAME_PARTICLES for w in words):
+        return False
+    # The first hint has to describe a person, not a work or a concept
+    hints = question.get('hints', [])
+    if not hints or _WORK_HINT.match(hints[0]):
+        return False
+    return bool(_PERSON_ROLE.match(hints[0]) or _PRONOUN.search(hints[0]))
+
+
+def common_words(questions):
+    # Words the bank itself uses in lowercase are too generic to be surnames
+    words = set(FRONTEND_COMMON_WORDS)
+    for question in questions:
+        for hint in question.get('hints', []):
+            words.update(_LOWER_WORD.findall(hint))
+    return words
+
+
+def surname(answer):
+    words = [w for w in fold_accents(answer).split() if w not in NAME_SUFFIXES]
+    # "Leonardo da Vinci" -> "da Vinci", "Martin Luther King Jr." -> "King"
+    for i, word in enumerate(words[1:], 1):
+        if word in NAME_PARTICLES:
+            return ' '.join(words[i:])
+    return words[-1]
+
+
+def canonical_forms(question, common=frozenset()):
+    answer = question['answer']
+    forms = {answer, _ARTICLE.sub('', answer)}
+    forms |= {fold_accents(form) for form in forms}
+    if looks_like_person(question):
+        name = surname(answer)
+        if fold_accents(name).lower() not in common:
+            forms.add(name)
+    return forms
+
+
+def typo_variants(word):
+    # Adjacent swaps and dropped double letters, the most common slips
+    variants = set()
+    for i in range(len(word) - 1):
+        if word[i] != word[i + 1]:
+            variants.add(word[:i] + word[i + 1] + word[i] + word[i + 2:])
+        else:
+            variants.add(word[:i] + word[i + 1:])
+    return variants
+
+
+def typo_forms(normalized, min_word_length):
+    words = normalized.split(' ')
+    for i, word in enumerate(words):
+        if len(word) < min_word_length:
+            continue
+        for variant in typo_variants(word):
+            yield ' '.join(words[:i] + [variant] + words[i + 1:])
+
+
+def question_aliases(question, matcher, typos=True, memo=None, common=frozenset()):
+    normalize, check = memo.matcher(matcher) if memo else MATCHERS[matcher]
+    aliases = {normalize(form) for form in canonical_forms(question, common)}
+
+    if typos:
+        # Typos are only indexed when the full matcher would accept them
+        # anyway, so a hit never changes the outcome of a guess
+        for alias in list(aliases):
+            for form in typo_forms(alias, 5):
+                if check(question['answer'], form):
+                    aliases.add(form)
+
+    return {alias for alias in aliases if len(alias.strip()) >= MIN_ALIAS_LENGTH}
+
+
+def build_alias_index(questions, matcher, typos=True, memo=None):
+    index = {}
+    common = common_words(questions)
+    if memo:
+        memo.preload('aliases')
+
+    def compute(question):
+        # Pair results are only needed once some question has changed
+        memo.preload('check', 'similarity')
+        return sorted(question_aliases(question, matcher, typos, memo, common))
+
+    for question in questions:
+        if memo:
+            # Keyed by the rules and the question's content, plus the one
+            # bank-wide input: whether its surname is a common word
+            common_surname = looks_like_person(question) and fold_accents(surname(question['answer'])).lower() in common
+            args = (RULES_VERSION, matcher, question_digest(question), 'typos' if typos else '',
+                    'common' if common_surname else '')
+            aliases = memo.get('aliases', args, lambda *_: compute(question))
+        else:
+            aliases = question_aliases(question, matcher, typos, common=common)
+        for alias in aliases:
+            index.setdefault(alias, []).append(question['id'])
+
+    # Single ids are stored bare to keep the artifact small
+    return {
+        alias: ids[0] if len(ids) == 1 else ids
+        for alias, ids in sorted(index.items())
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('banks', nargs='*', default=list(BANKS), help='backend, frontend or a path')
+    parser.add_argument('--matcher', choices=sorted(MATCHERS), help='defaults to the bank name')
+    parser.add_argument('--no-typos', action='store_true', help='skip typo variants')
+    parser.add_argument('--no-cache', action='store_true', help='recompute every matcher result')
+    args = parser.parse_args()
+
+    memo = None if args.no_cache else MemoCache()
+    for bank in args.banks:
+        matcher = args.matcher or (bank if bank in MATCHERS else 'backend')
+        questions = load_bank(bank)
+        aliases = build_alias_index(questions, matcher, typos=not args.no_typos, memo=memo)
+        output = artifact_path(bank, 'aliases.json')
+        write_artifact(output, {
+            'version': INDEX_VERSION,
+            'matcher': matcher,
+            'source': file_digest(bank)[:16],
+            'aliases': aliases,
+        })
+        print(f"{output}: {len(aliases)} aliases for {len(questions)} questions")
+
+    if memo:
+        memo.close()
+
+
+if __name__ == "__main__":
+    main()
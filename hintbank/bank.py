@@ -0,0 +1,62 @@
+import hashlib
+import json
+import os
+
+# Repository root, so the tools work from any working directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BACKEND_BANK = os.path.join(ROOT, 'backend', 'src', 'data', 'questions.json')
+FRONTEND_BANK = os.path.join(ROOT, 'frontend', 'src', 'data', 'questions.json')
+
+# The two catalogs are edited independently and use different answer matchers
+BANKS = {
+    'backend': BACKEND_BANK,
+    'frontend': FRONTEND_BANK,
+}
+
+
+def bank_path(name_or_path):
+    return BANKS.get(name_or_path, name_or_path)
+
+
+def load_bank(path):
+    with open(bank_path(path), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_bank(questions):
+    # Same layout as the checked-in files, so diffs stay readable
+    return json.dumps(questions, indent=2, ensure_ascii=False)
+
+
+def save_bank(path, questions, reason=None):
+    # Locked, journaled and atomic; see hintbank.journal
+    from .journal import write_bank
+    return write_bank(path, questions, reason)
+
+
+def artifact_path(path, suffix):
+    # questions.json -> questions.<suffix>
+    base, _ = os.path.splitext(bank_path(path))
+    return f"{base}.{suffix}"
+
+
+def write_artifact(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def bank_hash(questions):
+    # Version of a bank's content, independent of how the file was written
+    return hashlib.sha256(dump_bank(questions).encode('utf-8')).hexdigest()
+
+
+def file_digest(path):
+    with open(bank_path(path), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def question_digest(question):
+    # Stable per-question hash, independent of key order and file layout
+    canonical = json.dumps(question, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
@@ -0,0 +1,153 @@
+"""Monte Carlo estimate of how many games a player gets before repeats.
+
+Replays the room deck builders from ``backend/src/models`` against the real
+bank distribution: Quick Mission (5 random questions), Under Cover (5 from
+each player's specialty, opponent specialty drawn from the others) and
+Survival (20 random questions). Players are simulated in NumPy batches, and
+for each mode and difficulty we report the game in which a player first gets
+a question they have already seen. Requires NumPy.
+"""
+
+import argparse
+
+import numpy as np
+
+from .bank import load_bank
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# Mirrors GameRoom.getQuestionsForCategory for the Under Cover specialty ids
+SPECIALTY_CATEGORIES = {
+    'history': ['History'],
+    'science': ['Science', 'Physics', 'Biology', 'Chemistry'],
+    'literature': ['Literature'],
+    'geography': ['Geography'],
+    'entertainment': ['Entertainment', 'Music'],
+    'sports': ['Sports'],
+    'food': ['Food'],
+}
+
+GENERAL_QUESTIONS = 5
+SURVIVAL_QUESTIONS = 20
+UNDERCOVER_PER_PLAYER = 5
+
+
+def specialty_pool(questions, specialty):
+    # Same loose comparison as the server: equal or either one contains the other
+    names = [name.lower() for name in SPECIALTY_CATEGORIES[specialty]]
+    return np.array([
+        i for i, q in enumerate(questions)
+        if any(q['category'].lower() == n or n in q['category'].lower() or q['category'].lower() in n
+               for n in names)
+    ], dtype=np.int32)
+
+
+def draw(rng, pool, players, count):
+    # Same distribution as shuffleArray(...).slice(0, count): sample with
+    # replacement and redraw the few rows that picked a question twice
+    picks = rng.integers(len(pool), size=(players, count))
+    while True:
+        ordered = np.sort(picks, axis=1)
+        clash = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+        if not clash.any():
+            return pool[picks]
+        picks[clash] = rng.integers(len(pool), size=(int(clash.sum()), count))
+
+
+def simulate(rng, questions, deal, players, max_games):
+    difficulty = np.array([DIFFICULTIES.index(q['difficulty']) for q in questions], dtype=np.int8)
+    rows = np.arange(players)[:, None]
+
+    seen = np.zeros((players, len(questions)), dtype=bool)
+    first_any = np.full(players, max_games + 1, dtype=np.int32)
+    first_by_difficulty = np.full((players, len(DIFFICULTIES)), max_games + 1, dtype=np.int32)
+
+    for game in range(1, max_games + 1):
+        for picks in deal(rng, players):
+            repeated = seen[rows, picks]
+            seen[rows, picks] = True
+
+            hit = repeated.any(axis=1) & (first_any > game)
+            first_any[hit] = game
+            for d in range(len(DIFFICULTIES)):
+                hit = (repeated & (difficulty[picks] == d)).any(axis=1) & (first_by_difficulty[:, d] > game)
+                first_by_difficulty[hit, d] = game
+
+        if (first_by_difficulty <= max_games).all():
+            break
+
+    return first_any, first_by_difficulty, game
+
+
+def modes(questions):
+    everything = np.arange(len(questions), dtype=np.int32)
+    pools = {name: specialty_pool(questions, name) for name in SPECIALTY_CATEGORIES}
+
+    yield 'quick', lambda rng, n: [draw(rng, everything, n, GENERAL_QUESTIONS)]
+    yield 'survival', lambda rng, n: [draw(rng, everything, n, SURVIVAL_QUESTIONS)]
+
+    for name, pool in pools.items():
+        others = [other for other in pools if other != name]
+
+        def deal(rng, n, pool=pool, others=others):
+            # Matchmaking pairs different specialties; both halves are dealt
+            # to both players, so the opponent's pool matters too
+            opponent = rng.integers(len(others), size=n)
+            theirs = np.empty((n, UNDERCOVER_PER_PLAYER), dtype=np.int32)
+            for i, other in enumerate(others):
+                mask = opponent == i
+                if mask.any():
+                    theirs[mask] = draw(rng, pools[other], int(mask.sum()), UNDERCOVER_PER_PLAYER)
+            return [draw(rng, pool, n, UNDERCOVER_PER_PLAYER), theirs]
+
+        yield f"undercover:{name}", deal
+
+
+def summarize(first, max_games):
+    censored = first > max_games
+    if censored.all():
+        return f">{max_games}"
+    mean = first[~censored].mean()
+    suffix = f" ({censored.mean():.0%} >{max_games})" if censored.any() else ''
+    return f"{mean:.1f}/{np.percentile(first, 10):.0f}{suffix}"
+
+
+def run(questions, players, batch, max_games, seed):
+    rng = np.random.default_rng(seed)
+    results = []
+    for name, deal in modes(questions):
+        firsts, by_difficulty, games = [], [], 0
+        for start in range(0, players, batch):
+            count = min(batch, players - start)
+            first_any, first_d, played = simulate(rng, questions, deal, count, max_games)
+            firsts.append(first_any)
+            by_difficulty.append(first_d)
+            games += count * played
+        results.append((name, np.concatenate(firsts), np.concatenate(by_difficulty), games))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('bank', nargs='?', default='backend', help='backend, frontend or a path')
+    parser.add_argument('--players', type=int, default=100000)
+    parser.add_argument('--batch', type=int, default=20000)
+    parser.add_argument('--max-games', type=int, default=200)
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    questions = load_bank(args.bank)
+    results = run(questions, args.players, args.batch, args.max_games, args.seed)
+
+    print("Game of first repeat, mean/10th percentile")
+    print(f"{'mode':<26} {'any':>12} " + ' '.join(f"{d:>12}" for d in DIFFICULTIES))
+    total = 0
+    for name, first_any, first_d, games in results:
+        total += games
+        cells = [summarize(first_d[:, d], args.max_games) for d in range(len(DIFFICULTIES))]
+        print(f"{name:<26} {summarize(first_any, args.max_games):>12} " + ' '.join(f"{c:>12}" for c in cells))
+    print(f"\nSimulated {total:,} games")
+
+
+if __name__ == "__main__":
+    main()
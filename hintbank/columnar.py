@@ -0,0 +1,181 @@
+"""Memory-compact, column-oriented view of a question bank.
+
+A bank of plain dicts pays for a dict, a list and repeated category and
+difficulty strings per question. ``ColumnarBank`` keeps each field in a
+column instead:
+
+* category and difficulty as one-byte codes into small name tables
+* ids, answers and hints as single UTF-8 buffers with ``array`` offsets
+* the hints of row ``i`` as hint numbers ``hint_start[i]:hint_start[i + 1]``
+* any other fields, and the key order of rows that differ from ``FIELDS``,
+  in a sparse ``extras`` side column, so such rows round-trip unchanged
+
+Rows are read through ``QuestionView`` objects, which only hold a row
+number. The ``array`` columns support the buffer protocol, so NumPy can wrap
+them without copying (``numpy.frombuffer(bank.category_codes, numpy.uint8)``).
+"""
+
+from array import array
+
+from .bank import load_bank, save_bank
+
+FIELDS = ('id', 'answer', 'category', 'difficulty', 'hints')
+
+
+class StringColumn:
+    __slots__ = ('data', 'offsets')
+
+    def __init__(self, values):
+        # UTF-8 keeps one byte per ASCII character; a str buffer would widen
+        # to two or four bytes per character as soon as one accent appears
+        encoded = [value.encode('utf-8') for value in values]
+        self.data = b''.join(encoded)
+        self.offsets = array('L', [0])
+        end = 0
+        for value in encoded:
+            end += len(value)
+            self.offsets.append(end)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode('utf-8')
+
+    def find(self, value):
+        # Rows holding exactly ``value``, without decoding every string
+        value = value.encode('utf-8')
+        for i in range(len(self)):
+            start, end = self.offsets[i], self.offsets[i + 1]
+            if end - start == len(value) and self.data.startswith(value, start):
+                yield i
+
+
+class CodeColumn:
+    __slots__ = ('names', 'codes', '_lookup')
+
+    def __init__(self, values):
+        self.names = []
+        self._lookup = {}
+        self.codes = array('B', (self.code(value, add=True) for value in values))
+
+    def code(self, value, add=False):
+        if value not in self._lookup:
+            if not add:
+                return None
+            self._lookup[value] = len(self.names)
+            self.names.append(value)
+        return self._lookup[value]
+
+    def __getitem__(self, index):
+        return self.names[self.codes[index]]
+
+
+class QuestionView:
+    __slots__ = ('bank', 'row')
+
+    def __init__(self, bank, row):
+        self.bank = bank
+        self.row = row
+
+    @property
+    def id(self):
+        return self.bank.ids[self.row]
+
+    @property
+    def answer(self):
+        return self.bank.answers[self.row]
+
+    @property
+    def category(self):
+        return self.bank.categories[self.row]
+
+    @property
+    def difficulty(self):
+        return self.bank.difficulties[self.row]
+
+    @property
+    def hints(self):
+        return self.bank.hints(self.row)
+
+    def as_dict(self):
+        extra = self.bank.extras.get(self.row)
+        if extra is None:
+            return {field: getattr(self, field) for field in FIELDS}
+
+        keys, values = extra
+        if 'hints' not in keys and self.hints:
+            keys += ('hints',)
+        return {key: getattr(self, key) if key in FIELDS else values[key] for key in keys}
+
+    def __repr__(self):
+        return f"QuestionView({self.id!r}, {self.answer!r})"
+
+
+class ColumnarBank:
+    def __init__(self, questions):
+        questions = list(questions)
+        # Row -> (key order, fields outside FIELDS); most rows have no entry
+        self.extras = {
+            row: (tuple(q), {key: value for key, value in q.items() if key not in FIELDS})
+            for row, q in enumerate(questions) if tuple(q) != FIELDS
+        }
+
+        self.ids = StringColumn(q['id'] for q in questions)
+        self.answers = StringColumn(q['answer'] for q in questions)
+        self.categories = CodeColumn(q['category'] for q in questions)
+        self.difficulties = CodeColumn(q['difficulty'] for q in questions)
+        # A question without hints is kept as one with no hints
+        self.hint_text = StringColumn(hint for q in questions for hint in q.get('hints', ()))
+        self.hint_start = array('L', [0])
+        for q in questions:
+            self.hint_start.append(self.hint_start[-1] + len(q.get('hints', ())))
+
+    @classmethod
+    def load(cls, path):
+        return cls(load_bank(path))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, row):
+        if not -len(self) <= row < len(self):
+            raise IndexError(row)
+        return QuestionView(self, row % len(self))
+
+    def __iter__(self):
+        return (QuestionView(self, row) for row in range(len(self)))
+
+    def hints(self, row):
+        return [self.hint_text[i] for i in range(self.hint_start[row], self.hint_start[row + 1])]
+
+    def hint(self, row, number):
+        first, end = self.hint_start[row], self.hint_start[row + 1]
+        return self.hint_text[first + number] if first + number < end else None
+
+    def rows(self, category=None, difficulty=None):
+        # Filters compare one-byte codes rather than strings
+        wanted = []
+        for column, value in ((self.categories, category), (self.difficulties, difficulty)):
+            if value is not None:
+                wanted.append((column.codes, column.code(value)))
+        return [
+            row for row in range(len(self))
+            if all(codes[row] == code for codes, code in wanted)
+        ]
+
+    def replace_hints(self, replacements):
+        """Swap the hints of several rows in one rebuild of the hint buffer."""
+        hints = []
+        starts = array('L', [0])
+        for row in range(len(self)):
+            hints.extend(replacements[row] if row in replacements else self.hints(row))
+            starts.append(len(hints))
+        self.hint_text = StringColumn(hints)
+        self.hint_start = starts
+
+    def to_questions(self):
+        return [view.as_dict() for view in self]
+
+    def save(self, path, reason=None):
+        return save_bank(path, self.to_questions(), reason)
@@ -0,0 +1,171 @@
+"""Precompress bank artifacts and report their size and parse cost.
+
+Writes ``.gz`` (and ``.br`` when the optional ``brotli`` package is
+installed) next to every catalog and the generated artifacts the apps load
+(aliases, tries, sampling tables and the id lookup), then prints raw and
+compressed bytes with the measured parse time. Gzip sizes are checked
+against the budgets in ``budgets.json`` and the command exits non-zero when
+any artifact is over its limit; the frontend's ``prebuild`` script runs it,
+so ``npm run build`` stops there.
+"""
+
+import argparse
+import fnmatch
+import glob
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from .bank import BANKS, ROOT, artifact_path, bank_path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Generated files the apps import or serve, besides the catalogs themselves
+SHIPPED_ARTIFACTS = ('aliases.json', 'trie.json', 'sampling.json', 'lookup.json')
+
+DEFAULT_BUDGETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'budgets.json')
+
+# Reports the median of several JSON.parse runs per file, in milliseconds
+NODE_PARSE_TIMER = """
+const fs = require('fs');
+const result = {};
+for (const file of process.argv.slice(1)) {
+  const text = fs.readFileSync(file, 'utf8');
+  const runs = [];
+  for (let i = 0; i < 7; i++) {
+    const start = process.hrtime.bigint();
+    JSON.parse(text);
+    runs.push(Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  result[file] = runs.sort((a, b) => a - b)[3];
+}
+console.log(JSON.stringify(result));
+"""
+
+
+def find_artifacts(banks):
+    # Only what the apps load; reports and journals next to a bank are skipped
+    paths = []
+    for bank in banks:
+        path = bank_path(bank)
+        paths.append(path)
+        for suffix in SHIPPED_ARTIFACTS:
+            artifact = artifact_path(path, suffix)
+            if os.path.exists(artifact):
+                paths.append(artifact)
+        paths.extend(sorted(glob.glob(artifact_path(path, 'trie.*.json'))))
+    return paths
+
+
+def precompress(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    sizes = {'raw': len(raw)}
+    packed = gzip.compress(raw, compresslevel=9, mtime=0)
+    with open(f"{path}.gz", 'wb') as f:
+        f.write(packed)
+    sizes['gzip'] = len(packed)
+
+    if brotli is not None:
+        packed = brotli.compress(raw, quality=11)
+        with open(f"{path}.br", 'wb') as f:
+            f.write(packed)
+        sizes['brotli'] = len(packed)
+
+    return sizes
+
+
+def python_parse_ms(path, runs=7):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        json.loads(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)[runs // 2]
+
+
+def node_parse_ms(paths):
+    # The clients parse with V8, so prefer its numbers when Node is available
+    node = shutil.which('node')
+    if node is None or not paths:
+        return {}
+    output = subprocess.run([node, '-e', NODE_PARSE_TIMER, *paths],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def load_budgets(path):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def budget_for(path, budgets):
+    relative = os.path.relpath(path, ROOT).replace(os.sep, '/')
+    for pattern, limit in budgets.items():
+        if fnmatch.fnmatch(relative, pattern):
+            return limit
+    return None
+
+
+def build_report(paths, budgets):
+    node_times = node_parse_ms(paths)
+    report = []
+    for path in paths:
+        entry = {'file': os.path.relpath(path, ROOT)}
+        entry.update(precompress(path))
+        entry['parse_ms'] = round(node_times[path] if path in node_times else python_parse_ms(path), 3)
+        entry['budget'] = budget_for(path, budgets)
+        report.append(entry)
+    return report
+
+
+def print_report(report):
+    print(f"{'artifact':<52} {'raw':>9} {'gzip':>9} {'brotli':>9} {'parse ms':>9} {'budget':>9}")
+    for entry in report:
+        brotli_size = entry.get('brotli', '-')
+        budget = entry['budget'] if entry['budget'] is not None else '-'
+        flag = '  OVER' if over_budget(entry) else ''
+        print(f"{entry['file']:<52} {entry['raw']:>9} {entry['gzip']:>9} {brotli_size:>9} "
+              f"{entry['parse_ms']:>9} {budget:>9}{flag}")
+
+
+def over_budget(entry):
+    return entry['budget'] is not None and entry['gzip'] > entry['budget']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('banks', nargs='*', default=list(BANKS), help='backend, frontend or a path')
+    parser.add_argument('--budgets', default=DEFAULT_BUDGETS, help='JSON map of path globs to gzip byte limits')
+    parser.add_argument('--report', help='also write the report as JSON')
+    args = parser.parse_args()
+
+    report = build_report(find_artifacts(args.banks), load_budgets(args.budgets))
+    print_report(report)
+    if brotli is None:
+        print("\nbrotli is not installed; skipped .br variants (pip install brotli)")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    over = [entry['file'] for entry in report if over_budget(entry)]
+    if over:
+        print(f"\nOver budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
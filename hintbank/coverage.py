@@ -0,0 +1,97 @@
+"""Coverage of the ``replace_hints.py`` table against a bank.
+
+Joins ``specific_hints`` with an answer index of the bank built in one pass
+and sorts every table entry into one of:
+
+``unmatched``  no question has this answer any more
+``applied``    every question with this answer already has the entry's hints
+``pending``    the next ``replace_hints.py`` run would rewrite these questions
+``diverged``   the questions were rewritten since, so the entry is dead
+
+It also lists questions that still carry a generic hint but have no table
+entry, grouped by category. Nothing is written.
+
+    python3 -m hintbank.coverage
+    python3 -m hintbank.coverage --json
+"""
+
+import argparse
+import json
+
+import replace_hints
+
+from .bank import BACKEND_BANK, bank_path
+from .columnar import ColumnarBank
+
+
+def coverage(bank):
+    generic = set(replace_hints.generic_hints)
+    by_answer = {}
+    generic_rows = []
+    for row in range(len(bank)):
+        by_answer.setdefault(bank.answers[row], []).append(row)
+        if not generic.isdisjoint(bank.hints(row)):
+            generic_rows.append(row)
+
+    pending = replace_hints.find_replacements(bank)
+
+    report = {'unmatched': [], 'applied': [], 'pending': [], 'diverged': []}
+    for answer, hints in replace_hints.specific_hints.items():
+        rows = by_answer.get(answer)
+        if rows is None:
+            status = 'unmatched'
+        elif any(row in pending for row in rows):
+            status = 'pending'
+        elif all(bank.hints(row)[:len(hints)] == hints for row in rows):
+            status = 'applied'
+        else:
+            status = 'diverged'
+        report[status].append(answer)
+
+    uncovered = {}
+    for row in generic_rows:
+        if bank.answers[row] not in replace_hints.specific_hints:
+            uncovered.setdefault(bank.categories[row], []).append({'id': bank.ids[row], 'answer': bank.answers[row]})
+
+    report['uncovered'] = dict(sorted(uncovered.items()))
+    report['projected'] = len(pending)
+    return report
+
+
+def format_report(report, entries):
+    lines = [f"{len(replace_hints.specific_hints)} table entries"]
+    for status in ('unmatched', 'applied', 'pending', 'diverged'):
+        answers = report[status]
+        lines.append(f"  {status:<10} {len(answers):>4}")
+        if status != 'applied':
+            lines.extend(f"      {answer}" for answer in answers[:entries])
+            if len(answers) > entries:
+                lines.append(f"      ... {len(answers) - entries} more")
+
+    total = sum(len(questions) for questions in report['uncovered'].values())
+    lines.append(f"{total} generic-hinted questions without an entry")
+    for category, questions in report['uncovered'].items():
+        lines.append(f"  {category:<16} {len(questions):>4}  "
+                     + ', '.join(q['answer'] for q in questions[:entries])
+                     + (' ...' if len(questions) > entries else ''))
+
+    lines.append(f"replace_hints.py would rewrite {report['projected']} questions")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('bank', nargs='?', default=BACKEND_BANK, help='backend, frontend or a path')
+    parser.add_argument('--entries', type=int, default=10, help='names listed per group')
+    parser.add_argument('--json', action='store_true', help='print the full report as JSON')
+    args = parser.parse_args()
+
+    report = coverage(ColumnarBank.load(bank_path(args.bank)))
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print('\n'.join(format_report(report, args.entries)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Golden-snapshot regression checks for the bank pipeline.
+
+Each fixture bank in ``hintbank/fixtures/<name>.json`` is run through the
+``replace_hints.py`` pass and compared with ``<name>.golden.json``. A golden
+snapshot records the output's bank hash plus, per question id, the
+question's content hash and fields. Checking compares the bank hash first,
+then the per-question hashes, and only diffs the fields of questions whose
+hash changed, so large fixtures stay cheap when little has moved.
+
+    python3 -m hintbank.golden check
+    python3 -m hintbank.golden update      # accept the current output
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+import replace_hints
+
+from .bank import ROOT, bank_hash, dump_bank, load_bank, question_digest
+from .columnar import ColumnarBank
+
+FIXTURES = os.path.join(ROOT, 'hintbank', 'fixtures')
+
+
+def run_pipeline(questions):
+    bank = ColumnarBank(questions)
+    bank.replace_hints(replace_hints.find_replacements(bank))
+    return bank.to_questions()
+
+
+def fixture_paths(fixtures=FIXTURES):
+    return sorted(
+        path for path in glob.glob(os.path.join(fixtures, '*.json'))
+        if not path.endswith('.golden.json')
+    )
+
+
+def golden_path(fixture):
+    return fixture[:-len('.json')] + '.golden.json'
+
+
+def make_snapshot(questions):
+    return {
+        'version': 1,
+        'hash': bank_hash(questions),
+        'order': [q['id'] for q in questions],
+        'records': {
+            q['id']: {'digest': question_digest(q), 'question': q}
+            for q in questions
+        },
+    }
+
+
+def diff_fields(old, new):
+    # Field-level differences; hint lists are compared position by position
+    changes = []
+    for field in sorted(old.keys() | new.keys()):
+        before, after = old.get(field), new.get(field)
+        if before == after:
+            continue
+        if isinstance(before, list) and isinstance(after, list):
+            for number in range(max(len(before), len(after))):
+                b = before[number] if number < len(before) else None
+                a = after[number] if number < len(after) else None
+                if b != a:
+                    changes.append((f"{field}[{number}]", b, a))
+        else:
+            changes.append((field, before, after))
+    return changes
+
+
+def compare(snapshot, questions):
+    """Differences between a golden snapshot and pipeline output.
+
+    Returns ``{'added': [...], 'removed': [...], 'changed': {id: [(field,
+    old, new)]}, 'reordered': bool}``; every entry is empty when they match.
+    """
+    result = {'added': [], 'removed': [], 'changed': {}, 'reordered': False}
+    if bank_hash(questions) == snapshot['hash']:
+        return result
+
+    records = snapshot['records']
+    seen = set()
+    for q in questions:
+        qid = q['id']
+        seen.add(qid)
+        record = records.get(qid)
+        if record is None:
+            result['added'].append(qid)
+        elif question_digest(q) != record['digest']:
+            result['changed'][qid] = diff_fields(record['question'], q)
+    result['removed'] = [qid for qid in snapshot['order'] if qid not in seen]
+
+    if not (result['added'] or result['removed'] or result['changed']):
+        # Same records with the same content, so only the order can differ
+        result['reordered'] = [q['id'] for q in questions] != snapshot['order']
+    return result
+
+
+def check(fixture):
+    with open(golden_path(fixture), 'r', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    return compare(snapshot, run_pipeline(load_bank(fixture)))
+
+
+def update(fixture):
+    snapshot = make_snapshot(run_pipeline(load_bank(fixture)))
+    with open(golden_path(fixture), 'w', encoding='utf-8') as f:
+        f.write(dump_bank(snapshot) + '\n')
+    return len(snapshot['records'])
+
+
+def format_result(name, result, limit):
+    lines = []
+    for qid in result['added']:
+        lines.append(f"  + {qid}")
+    for qid in result['removed']:
+        lines.append(f"  - {qid}")
+    for qid, changes in result['changed'].items():
+        lines.append(f"  ~ {qid}")
+        for field, before, after in changes[:limit]:
+            lines.append(f"      {field}: {before!r}")
+            lines.append(f"      {' ' * len(field)}  -> {after!r}")
+        if len(changes) > limit:
+            lines.append(f"      ... {len(changes) - limit} more")
+    if result['reordered']:
+        lines.append('  question order changed')
+    return [f"{name}: {'FAIL' if lines else 'ok'}"] + lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['check', 'update'])
+    parser.add_argument('fixtures', nargs='*', help='fixture banks (default: hintbank/fixtures/*.json)')
+    parser.add_argument('--limit', type=int, default=10, help='field changes shown per question')
+    args = parser.parse_args()
+
+    failed = False
+    for fixture in args.fixtures or fixture_paths():
+        name = os.path.basename(fixture)
+        if args.command == 'update':
+            print(f"{name}: wrote {update(fixture)} records to {os.path.basename(golden_path(fixture))}")
+            continue
+
+        if not os.path.exists(golden_path(fixture)):
+            print(f"{name}: FAIL\n  no golden snapshot")
+            failed = True
+            continue
+
+        result = check(fixture)
+        lines = format_result(name, result, args.limit)
+        failed = failed or len(lines) > 1
+        print('\n'.join(lines))
+
+    if failed:
+        print("\nRun 'python3 -m hintbank.golden update' if these changes are intended.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Advisory locking and an append-only change journal for bank writes.
+
+Every ``save_bank`` goes through ``write_bank``: it takes an exclusive
+``flock`` on ``<bank>.lock``, appends a journal entry, and only then
+replaces the bank atomically. An entry holds forward and backward
+per-question patches (see ``hintbank.versions``) plus the before and after
+hash of every touched question, so any journal point can be reached by
+applying patches from the current state instead of replaying the history.
+
+Next to ``questions.json`` the journal keeps:
+
+``questions.journal.jsonl``  one JSON entry per line, append-only
+``questions.journal.idx``    8-byte little-endian offset of every entry
+
+If a write dies between the journal append and the file replace, the next
+locked operation finds the bank still at the entry's ``from`` hash and rolls
+it forward (``python3 -m hintbank.journal recover`` does this explicitly).
+Hand edits to the file are folded into the next journaled write; walking
+back across one stops with an error, since the patches no longer line up.
+
+    python3 -m hintbank.journal log backend
+    python3 -m hintbank.journal rollback 12 backend
+"""
+
+import argparse
+import contextlib
+import fcntl
+import json
+import os
+import struct
+import time
+
+from .bank import artifact_path, bank_path, bank_hash, dump_bank, load_bank, question_digest
+from .versions import apply_patch, make_patch
+
+# Paths locked by this process, so nested write_bank calls don't deadlock
+_held = {}
+
+
+@contextlib.contextmanager
+def bank_lock(path, recover=True):
+    """Hold the bank's lock; the outermost holder finishes interrupted writes first."""
+    path = os.path.abspath(bank_path(path))
+    if path in _held:
+        _held[path] += 1
+        try:
+            yield
+        finally:
+            _held[path] -= 1
+        return
+
+    with open(f"{path}.lock", 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        _held[path] = 1
+        try:
+            # Anything read under the lock must already include a pending entry
+            if recover:
+                _recover_locked(path)
+            yield
+        finally:
+            del _held[path]
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def journal_paths(path):
+    return artifact_path(path, 'journal.jsonl'), artifact_path(path, 'journal.idx')
+
+
+def entry_count(path):
+    _, index = journal_paths(path)
+    try:
+        return os.path.getsize(index) // 8
+    except FileNotFoundError:
+        return 0
+
+
+def read_entry(path, seq):
+    journal, index = journal_paths(path)
+    with open(index, 'rb') as f:
+        f.seek(seq * 8)
+        offset, = struct.unpack('<Q', f.read(8))
+    with open(journal, 'rb') as f:
+        f.seek(offset)
+        return json.loads(f.readline())
+
+
+def append_entry(path, entry):
+    journal, index = journal_paths(path)
+    entry['seq'] = entry_count(path)
+    line = (json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+    with open(journal, 'ab') as f:
+        offset = f.tell()
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+    # The index is written last: an entry without an offset was never committed
+    with open(index, 'ab') as f:
+        f.write(struct.pack('<Q', offset))
+        f.flush()
+        os.fsync(f.fileno())
+    return entry['seq']
+
+
+def atomic_write(path, questions):
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(dump_bank(questions) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def question_hashes(old, new):
+    before = {q['id']: question_digest(q) for q in old}
+    after = {q['id']: question_digest(q) for q in new}
+    return {
+        qid: [before.get(qid), after.get(qid)]
+        for qid in sorted(before.keys() | after.keys(), key=str)
+        if before.get(qid) != after.get(qid)
+    }
+
+
+def _recover_locked(path):
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(f"{path}.tmp")
+
+    count = entry_count(path)
+    if count == 0 or not os.path.exists(path):
+        return None
+
+    last = read_entry(path, count - 1)
+    current = load_bank(path)
+    if bank_hash(current) == last['forward']['from'] != last['forward']['to']:
+        # Crashed after journaling but before the replace: finish the write
+        atomic_write(path, apply_patch(current, last['forward']))
+        return last['seq']
+    # Otherwise the file is either current or was edited by hand; hand edits
+    # are picked up as part of the next journaled write
+    return None
+
+
+def recover(path):
+    path = bank_path(path)
+    with bank_lock(path, recover=False):
+        return _recover_locked(path)
+
+
+def _journal(path, old, new, reason):
+    return append_entry(path, {
+        'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'reason': reason,
+        'questions': question_hashes(old, new),
+        'forward': make_patch(old, new),
+        'backward': make_patch(new, old),
+    })
+
+
+def write_bank(path, questions, reason=None):
+    path = bank_path(path)
+    with bank_lock(path):
+        old = load_bank(path) if os.path.exists(path) else []
+        if bank_hash(old) == bank_hash(questions):
+            return None
+        seq = _journal(path, old, questions, reason)
+        atomic_write(path, questions)
+        return seq
+
+
+def checkout(path, seq):
+    """Bank contents right after journal entry ``seq``, without writing."""
+    path = bank_path(path)
+    with bank_lock(path):
+        count = entry_count(path)
+        # -1 is the bank as it was before the first entry
+        if not -1 <= seq < count:
+            raise ValueError(f"No journal entry {seq} for {path}; expected -1 to {count - 1}")
+        questions = load_bank(path)
+        # Only the entries after ``seq`` are read, newest first
+        for later in range(count - 1, seq, -1):
+            questions = apply_patch(questions, read_entry(path, later)['backward'])
+        return questions
+
+
+def rollback(path, seq):
+    path = bank_path(path)
+    with bank_lock(path):
+        return write_bank(path, checkout(path, seq), f"rollback to {seq}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    log_parser = commands.add_parser('log', help='list journal entries')
+    log_parser.add_argument('bank', nargs='?', default='backend')
+    log_parser.add_argument('--limit', type=int, default=20)
+
+    rollback_parser = commands.add_parser('rollback', help='restore the bank as of an entry')
+    rollback_parser.add_argument('seq', type=int)
+    rollback_parser.add_argument('bank', nargs='?', default='backend')
+
+    checkout_parser = commands.add_parser('checkout', help='write the bank as of an entry elsewhere')
+    checkout_parser.add_argument('seq', type=int)
+    checkout_parser.add_argument('output')
+    checkout_parser.add_argument('bank', nargs='?', default='backend')
+
+    recover_parser = commands.add_parser('recover', help='finish an interrupted write')
+    recover_parser.add_argument('bank', nargs='?', default='backend')
+
+    args = parser.parse_args()
+
+    if args.command == 'log':
+        count = entry_count(args.bank)
+        for seq in range(max(0, count - args.limit), count):
+            entry = read_entry(args.bank, seq)
+            print(f"{seq:>5} {entry['time']} {entry['forward']['to'][:12]} "
+                  f"{len(entry['questions']):>5} questions  {entry.get('reason') or ''}")
+    elif args.command == 'rollback':
+        try:
+            seq = rollback(args.bank, args.seq)
+        except ValueError as error:
+            parser.error(str(error))
+        print(f"Rolled back to entry {args.seq}" + (f" as entry {seq}" if seq is not None else ' (no change)'))
+    elif args.command == 'checkout':
+        try:
+            questions = checkout(args.bank, args.seq)
+        except ValueError as error:
+            parser.error(str(error))
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(dump_bank(questions) + '\n')
+        print(f"Wrote entry {args.seq} to {args.output}")
+    else:
+        seq = recover(args.bank)
+        print(f"Completed entry {seq}" if seq is not None else 'Nothing to recover')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""Drive the Socket.IO game server with thousands of simulated players.
+
+Each player connects, queues through ``findMatch`` or ``findSurvivalMatch``,
+readies up for Survival, and answers hints with a mix of correct guesses
+(looked up from the bank by hint text) and wrong ones. A share of players
+drop mid-game and come back through ``checkReconnect``/``reconnectToGame``.
+The run reports matchmaking latency, event round-trip percentiles and
+throughput. Requires ``python-socketio[asyncio_client]``.
+
+    python3 -m hintbank.loadtest --start-server --players 2000 --ramp 200
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import time
+import urllib.request
+
+import socketio
+
+from .bank import ROOT, load_bank
+
+SPECIALTIES = ['history', 'science', 'literature', 'geography', 'entertainment', 'sports', 'food']
+MODES = ['quick', 'undercover', 'survival']
+
+# No event should take longer than a full 120s target plus transitions
+EVENT_TIMEOUT = 150
+
+
+class Metrics:
+    def __init__(self):
+        self.samples = {}
+        self.counts = {}
+        self.started = time.perf_counter()
+
+    def record(self, name, seconds):
+        self.samples.setdefault(name, []).append(seconds * 1000)
+
+    def count(self, name, amount=1):
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def report(self):
+        elapsed = time.perf_counter() - self.started
+        print(f"{'latency (ms)':<22} {'count':>7} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+        for name, values in sorted(self.samples.items()):
+            values.sort()
+            pick = lambda q: values[min(len(values) - 1, int(q * len(values)))]
+            print(f"{name:<22} {len(values):>7} {pick(0.5):>9.1f} {pick(0.9):>9.1f} "
+                  f"{pick(0.99):>9.1f} {values[-1]:>9.1f}")
+
+        print(f"\n{'counter':<22} {'total':>7} {'per sec':>9}")
+        for name, total in sorted(self.counts.items()):
+            print(f"{name:<22} {total:>7} {total / elapsed:>9.1f}")
+        print(f"\nWall time {elapsed:.1f}s")
+
+
+class SimulatedPlayer:
+    def __init__(self, name, mode, options, bank, metrics):
+        self.name = name
+        self.mode = mode
+        self.options = options
+        self.bank = bank
+        self.metrics = metrics
+        self.rng = random.Random(name)
+        self.client = None
+        self.events = None
+
+    async def connect(self):
+        self.events = asyncio.Queue()
+        self.client = socketio.AsyncClient(reconnection=False)
+
+        async def on_event(event, data=None):
+            self.metrics.count('events received')
+            await self.events.put((event, data, time.perf_counter()))
+
+        self.client.on('*', on_event)
+        started = time.perf_counter()
+        await self.client.connect(self.options.url, transports=['websocket'])
+        self.metrics.record('connect', time.perf_counter() - started)
+
+    async def wait_for(self, *names, match=None):
+        # Drops unrelated events; the game loop consumes events itself
+        deadline = time.perf_counter() + EVENT_TIMEOUT
+        while True:
+            remaining = deadline - time.perf_counter()
+            event, data, received = await asyncio.wait_for(self.events.get(), remaining)
+            if event in names and (match is None or match(data or {})):
+                return event, data or {}, received
+
+    async def emit(self, event, data=None):
+        self.metrics.count('events sent')
+        await self.client.emit(event, data)
+
+    def match_request(self):
+        if self.mode == 'survival':
+            return 'findSurvivalMatch', {'playerName': self.name, 'gameMode': 'survival'}
+        if self.mode == 'undercover':
+            specialty = self.rng.choice(SPECIALTIES)
+            return 'findMatch', {
+                'playerName': self.name,
+                'gameMode': 'category',
+                'personalCategory': specialty,
+                'personalCategoryName': specialty.title(),
+            }
+        return 'findMatch', {'playerName': self.name, 'gameMode': 'general'}
+
+    async def find_match(self):
+        event, payload = self.match_request()
+        started = time.perf_counter()
+        await self.emit(event, payload)
+        event, _, received = await self.wait_for('matchFound', 'matchTimeout')
+        if event == 'matchTimeout':
+            self.metrics.count('match timeouts')
+            return False
+        self.metrics.record(f"match {self.mode}", received - started)
+
+        if self.mode == 'survival':
+            sid = self.client.get_sid()
+            started = time.perf_counter()
+            await self.emit('playerReady')
+            _, _, received = await self.wait_for('playerReady', match=lambda d: d.get('playerId') == sid)
+            self.metrics.record('playerReady', received - started)
+        return True
+
+    async def churn(self):
+        # Drop the socket, then come back the way the client app does
+        await self.client.disconnect()
+        self.metrics.count('disconnects')
+        await asyncio.sleep(self.rng.uniform(0.5, 3.0))
+        await self.connect()
+
+        started = time.perf_counter()
+        await self.emit('checkReconnect', {'playerName': self.name})
+        _, info, _ = await self.wait_for('canReconnect')
+        if not info.get('canReconnect'):
+            self.metrics.count('reconnects refused')
+            return False
+
+        await self.emit('reconnectToGame', {'roomId': info['roomId'], 'playerName': self.name})
+        event, _, received = await self.wait_for('reconnectSuccess', 'reconnectFailed')
+        if event == 'reconnectFailed':
+            self.metrics.count('reconnects failed')
+            return False
+        self.metrics.record('reconnect', received - started)
+        return True
+
+    def pick_guess(self, candidates):
+        if candidates and len(candidates) == 1 and self.rng.random() < self.options.accuracy:
+            return next(iter(candidates))
+        return self.rng.choice(self.bank['answers'])
+
+    async def play(self):
+        pending = []
+        candidates = None
+        while True:
+            event, data, received = await self.wait_for(
+                'questionStart', 'hintRevealed', 'wrongAnswer', 'questionResult', 'gameEnd', 'gamePaused')
+            data = data or {}
+
+            if event == 'gameEnd':
+                self.metrics.count('games completed')
+                return
+            if event == 'questionStart':
+                candidates = None
+                pending.clear()
+                if self.rng.random() < self.options.churn and not await self.churn():
+                    return
+            elif event == 'hintRevealed':
+                # Narrow the possible answers with each clue, as a player would
+                hinted = self.bank['by_hint'].get(data.get('text'), set())
+                candidates = hinted if candidates is None else (candidates & hinted or hinted)
+                if self.rng.random() < self.options.guess_rate:
+                    pending.append(time.perf_counter())
+                    self.metrics.count('guesses')
+                    await self.emit('submitGuess', {'guess': self.pick_guess(candidates)})
+            elif event == 'wrongAnswer' and data.get('playerId') == self.client.get_sid() and pending:
+                self.metrics.record('submitGuess', received - pending.pop(0))
+            elif event == 'questionResult' and pending:
+                if data.get('winner') == self.client.get_sid():
+                    self.metrics.record('submitGuess', received - pending.pop(0))
+                pending.clear()
+
+    async def run(self):
+        try:
+            await self.connect()
+            for _ in range(self.options.games):
+                if not await self.find_match():
+                    break
+                await self.play()
+        except (asyncio.TimeoutError, socketio.exceptions.SocketIOError) as error:
+            self.metrics.count(f"errors {type(error).__name__}")
+        finally:
+            if self.client and self.client.connected:
+                await self.client.disconnect()
+
+
+def index_bank(questions):
+    by_hint = {}
+    for question in questions:
+        for hint in question.get('hints', []):
+            by_hint.setdefault(hint, set()).add(question['answer'])
+    return {'by_hint': by_hint, 'answers': [q['answer'] for q in questions]}
+
+
+def start_server(port):
+    env = dict(os.environ, PORT=str(port))
+    process = subprocess.Popen(['node', 'server.js'], cwd=os.path.join(ROOT, 'backend'), env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(60):
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"Server did not become healthy on port {port}")
+
+
+async def run_load(options, bank):
+    metrics = Metrics()
+    tasks = []
+    for index in range(options.players):
+        mode = options.mode if options.mode != 'mixed' else MODES[index % len(MODES)]
+        player = SimulatedPlayer(f"load-{options.run_id}-{index}", mode, options, bank, metrics)
+        tasks.append(asyncio.create_task(player.run()))
+        if options.ramp:
+            await asyncio.sleep(1 / options.ramp)
+    await asyncio.gather(*tasks)
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help='server URL, default http://127.0.0.1:<port>')
+    parser.add_argument('--port', type=int, default=10000)
+    parser.add_argument('--start-server', action='store_true', help='run backend/server.js for the test')
+    parser.add_argument('--bank', default='backend', help='bank used to answer hints')
+    parser.add_argument('--players', type=int, default=200)
+    parser.add_argument('--ramp', type=float, default=100, help='new players per second, 0 for all at once')
+    parser.add_argument('--mode', choices=MODES + ['mixed'], default='mixed')
+    parser.add_argument('--games', type=int, default=1, help='games per player')
+    parser.add_argument('--guess-rate', type=float, default=0.5, help='chance to guess after each hint')
+    parser.add_argument('--accuracy', type=float, default=0.7, help='chance a guess is correct once known')
+    parser.add_argument('--churn', type=float, default=0.05, help='chance to drop and reconnect per target')
+    options = parser.parse_args()
+    options.url = options.url or f"http://127.0.0.1:{options.port}"
+    options.run_id = f"{int(time.time()) % 100000}"
+
+    bank = index_bank(load_bank(options.bank))
+    server = start_server(options.port) if options.start_server else None
+    try:
+        metrics = asyncio.run(run_load(options, bank))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    metrics.report()
+
+
+if __name__ == "__main__":
+    main()
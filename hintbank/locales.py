@@ -0,0 +1,230 @@
+"""Run the hint replacement pass over every locale's bank in parallel.
+
+The English catalog (``backend/src/data/questions.json``) is the reference.
+Translations live next to it and reuse its question ids:
+
+``backend/src/data/locales/<locale>/questions.json``  translated bank
+``hintbank/replacements/<locale>.json``               ``generic_hints``,
+                                                      ``specific_hints`` and
+                                                      optional ``articles``
+
+English uses the tables in ``replace_hints.py`` and matches answers exactly,
+like the script itself. Other locales match answers to table entries by a
+locale key (accents folded, case folded, leading article and punctuation
+dropped), so "Les Misérables" and "Les Miserables" share an entry; when two
+entries share a key, the first is used and the other is reported as a
+collision. Each locale runs in its own worker process, so wall-clock time
+stays close to that of the slowest locale; the combined report lists id
+drift against the reference bank, table entries with no matching answer,
+and replacements per locale. Banks are only rewritten with ``--write``.
+
+    python3 -m hintbank.locales
+    python3 -m hintbank.locales fr es --write
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import replace_hints
+
+from .bank import BACKEND_BANK, ROOT
+from .columnar import ColumnarBank
+from .journal import bank_lock
+from .matching import fold_accents
+
+REFERENCE_LOCALE = 'en'
+DATA_DIR = os.path.dirname(BACKEND_BANK)
+TABLES_DIR = os.path.join(ROOT, 'hintbank', 'replacements')
+
+# Leading articles dropped when keying answers; elided forms end in "'"
+ARTICLES = {
+    'en': ['the', 'a', 'an'],
+    'fr': ['le', 'la', 'les', "l'", 'un', 'une', 'des'],
+    'es': ['el', 'la', 'los', 'las', 'un', 'una'],
+    'pt': ['o', 'a', 'os', 'as', 'um', 'uma'],
+    'it': ['il', 'lo', 'la', 'i', 'gli', 'le', "l'", 'un', 'uno', 'una'],
+    'de': ['der', 'die', 'das', 'ein', 'eine'],
+    'nl': ['de', 'het', 'een'],
+}
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r'\s+')
+
+
+def article_pattern(articles):
+    words = sorted(articles, key=len, reverse=True)
+    alternatives = [re.escape(w) if w.endswith("'") else re.escape(w) + r'\s+' for w in words]
+    return re.compile(r'^(?:' + '|'.join(alternatives) + ')')
+
+
+def locale_key(text, articles):
+    text = fold_accents(text).casefold().strip()
+    text = articles.sub('', text)
+    text = _PUNCTUATION.sub(' ', text)
+    return _SPACES.sub(' ', text).strip()
+
+
+def locale_banks(data_dir=DATA_DIR):
+    banks = {REFERENCE_LOCALE: os.path.join(data_dir, 'questions.json')}
+    locales_dir = os.path.join(data_dir, 'locales')
+    if os.path.isdir(locales_dir):
+        for locale in sorted(os.listdir(locales_dir)):
+            path = os.path.join(locales_dir, locale, 'questions.json')
+            if os.path.exists(path):
+                banks[locale] = path
+    return banks
+
+
+def load_table(locale, tables_dir=TABLES_DIR):
+    if locale == REFERENCE_LOCALE:
+        table = {'generic_hints': replace_hints.generic_hints, 'specific_hints': replace_hints.specific_hints}
+    else:
+        path = os.path.join(tables_dir, f"{locale}.json")
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            table = json.load(f)
+    table.setdefault('articles', ARTICLES.get(locale.split('-')[0], []))
+    return table
+
+
+def table_key(locale, table):
+    # English keeps replace_hints.py's exact matching, so --write, the script
+    # and hintbank.coverage always agree on which questions change
+    if locale == REFERENCE_LOCALE:
+        return lambda answer: answer
+    return partial(locale_key, articles=article_pattern(table['articles']))
+
+
+def process_locale(locale, path, table, reference_ids, write):
+    started = time.perf_counter()
+    # Load to save under the lock, so a concurrent edit is never overwritten
+    with bank_lock(path):
+        bank = ColumnarBank.load(path)
+        ids = [bank.ids[row] for row in range(len(bank))]
+        present = set(ids)
+
+        report = {
+            'locale': locale,
+            'bank': os.path.relpath(path, ROOT) if path.startswith(ROOT + os.sep) else path,
+            'questions': len(bank),
+            'missing': sorted(reference_ids - present),
+            'extra': sorted(present - reference_ids),
+            'duplicates': len(ids) - len(present),
+            'entries': 0,
+            'unmatched': [],
+            'collisions': [],
+            'replaced': 0,
+            'uncovered': 0,
+            'written': False,
+        }
+
+        if table is not None:
+            key = table_key(locale, table)
+            keyed = {}
+            first = {}
+            for answer, hints in table['specific_hints'].items():
+                if key(answer) in keyed:
+                    report['collisions'].append(f"{answer} (same key as {first[key(answer)]})")
+                    continue
+                keyed[key(answer)] = hints
+                first[key(answer)] = answer
+            answers = {key(bank.answers[row]) for row in range(len(bank))}
+
+            replacements = replace_hints.find_replacements(bank, keyed, table['generic_hints'], key)
+            generic_rows = sum(1 for row in range(len(bank)) if bank.hint(row, 0) == table['generic_hints'][0])
+
+            report['entries'] = len(table['specific_hints'])
+            report['unmatched'] = sorted(
+                answer for answer in table['specific_hints'] if key(answer) not in answers
+            )
+            report['replaced'] = len(replacements)
+            report['uncovered'] = generic_rows - len(replacements)
+
+            if write and replacements:
+                bank.replace_hints(replacements)
+                bank.save(path, f"hintbank.locales ({locale})")
+                report['written'] = True
+
+    report['seconds'] = round(time.perf_counter() - started, 3)
+    return report
+
+
+def run(locales, data_dir=DATA_DIR, tables_dir=TABLES_DIR, write=False, workers=None):
+    banks = locale_banks(data_dir)
+    unknown = [locale for locale in locales if locale not in banks]
+    if unknown:
+        raise ValueError(f"No bank for {', '.join(unknown)} in {data_dir}")
+
+    reference = ColumnarBank.load(banks[REFERENCE_LOCALE])
+    reference_ids = {reference.ids[row] for row in range(len(reference))}
+
+    selected = locales or list(banks)
+    workers = workers or min(len(selected), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(process_locale, locale, banks[locale], load_table(locale, tables_dir), reference_ids, write)
+            for locale in selected
+        ]
+        return [future.result() for future in futures]
+
+
+def format_report(reports, entries):
+    lines = [f"{'locale':<8} {'questions':>9} {'missing':>8} {'extra':>6} {'entries':>8} "
+             f"{'unmatched':>10} {'replaced':>9} {'uncovered':>10} {'seconds':>8}"]
+    for r in reports:
+        replaced = f"{r['replaced']}{'*' if r['written'] else ''}"
+        lines.append(f"{r['locale']:<8} {r['questions']:>9} {len(r['missing']):>8} {len(r['extra']):>6} "
+                     f"{r['entries']:>8} {len(r['unmatched']):>10} {replaced:>9} {r['uncovered']:>10} "
+                     f"{r['seconds']:>8.2f}")
+
+    for r in reports:
+        notes = []
+        if r['duplicates']:
+            notes.append(f"{r['duplicates']} duplicate ids")
+        for field in ('missing', 'extra', 'unmatched', 'collisions'):
+            if r[field]:
+                shown = ', '.join(r[field][:entries])
+                more = f" ... {len(r[field]) - entries} more" if len(r[field]) > entries else ''
+                notes.append(f"{field}: {shown}{more}")
+        if r['locale'] != REFERENCE_LOCALE and not r['entries']:
+            notes.append('no replacement table')
+        if notes:
+            lines.append(f"\n{r['locale']} ({r['bank']})")
+            lines.extend(f"  {note}" for note in notes)
+
+    if any(r['written'] for r in reports):
+        lines.append('\n* written to the bank')
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('locales', nargs='*', help='locales to process (default: all found)')
+    parser.add_argument('--data', default=DATA_DIR, help='directory holding questions.json and locales/')
+    parser.add_argument('--tables', default=TABLES_DIR, help='directory of <locale>.json replacement tables')
+    parser.add_argument('--write', action='store_true', help='apply the replacements to the banks')
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per locale, up to the CPU count)')
+    parser.add_argument('--entries', type=int, default=5, help='ids and answers listed per group')
+    parser.add_argument('--json', action='store_true', help='print the reports as JSON')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    reports = run(args.locales, args.data, args.tables, args.write, args.workers)
+
+    if args.json:
+        print(json.dumps(reports, indent=2, ensure_ascii=False))
+        return
+
+    print('\n'.join(format_report(reports, args.entries)))
+    print(f"\n{len(reports)} locales in {time.perf_counter() - started:.2f}s "
+          f"({sum(r['seconds'] for r in reports):.2f}s of worker time)")
+
+
+if __name__ == "__main__":
+    main()
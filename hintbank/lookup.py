@@ -0,0 +1,40 @@
+"""Publish the id -> question lookup used to resolve id-only room snapshots.
+
+Room snapshots in Redis store ``questionIds`` plus the ``bankVersion`` they
+were dealt from. This writes ``questions.lookup.json`` next to the bank with
+the same version hash, so any consumer can turn those ids back into
+questions (older versions are kept by ``hintbank.versions``).
+"""
+
+import argparse
+
+from .bank import artifact_path, bank_hash, load_bank, write_artifact
+
+LOOKUP_VERSION = 1
+
+
+def build_lookup(questions):
+    return {
+        'version': LOOKUP_VERSION,
+        'bankVersion': bank_hash(questions),
+        'questions': {
+            q['id']: {key: value for key, value in q.items() if key != 'id'}
+            for q in questions
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('banks', nargs='*', default=['backend'], help='backend, frontend or a path')
+    args = parser.parse_args()
+
+    for bank in args.banks:
+        lookup = build_lookup(load_bank(bank))
+        output = artifact_path(bank, 'lookup.json')
+        write_artifact(output, lookup)
+        print(f"{output}: {len(lookup['questions'])} questions, version {lookup['bankVersion'][:12]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Python ports of the answer matchers.
+
+``backend`` mirrors ``backend/src/models/Question.js`` and ``frontend``
+mirrors ``frontend/src/classes/Question.js``. Keep them in step with the
+JavaScript, since generated artifacts are keyed by these normalizations.
+"""
+
+import re
+import unicodedata
+
+# JavaScript's \w is ASCII-only, so accented letters are dropped, not kept
+_BACKEND_STRIP = re.compile(r'[^A-Za-z0-9_\s]')
+_FRONTEND_STRIP = re.compile(r"[.,/#!$%^&*;:{}=\-_`~()'\"]")
+_SPACES = re.compile(r'\s+')
+_LEADING_ARTICLE = re.compile(r'^(the|a|an)\s+', re.IGNORECASE)
+_MIDDLE_ARTICLE = re.compile(r'\s+(the|a|an)\s+', re.IGNORECASE)
+_PREPOSITION = re.compile(r'\s+(of|in|on|at|by|for|with)\s+', re.IGNORECASE)
+_NUMBER = re.compile(r'^\d+$')
+
+FRONTEND_COMMON_WORDS = frozenset([
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'it', 'its', 'this', 'that', 'these', 'those', 'from', 'up', 'out',
+    'so', 'as', 'if', 'no', 'not', 'only', 'own', 'same', 'such', 'than',
+    'too', 'very', 'can', 'just', 'his', 'her', 'him', 'she', 'he'
+])
+
+
+def fold_accents(text):
+    # "Schrödinger" -> "Schrodinger"; typographic quotes become ASCII ones
+    text = text.replace('’', "'").replace('‘', "'")
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def backend_normalize(text):
+    text = _BACKEND_STRIP.sub('', text.lower().strip())
+    return _SPACES.sub(' ', text)
+
+
+def frontend_normalize(text):
+    text = _FRONTEND_STRIP.sub('', text.lower().strip())
+    text = _SPACES.sub(' ', text)
+    text = _LEADING_ARTICLE.sub('', text)
+    text = _MIDDLE_ARTICLE.sub(' ', text)
+    text = _PREPOSITION.sub(' ', text)
+    return text.strip()
+
+
+def backend_check(answer, guess):
+    if not guess:
+        return False
+
+    normalized_answer = backend_normalize(answer)
+    normalized_guess = backend_normalize(guess)
+
+    if normalized_answer == normalized_guess:
+        return True
+
+    if normalized_guess in normalized_answer or normalized_answer in normalized_guess:
+        shorter = min(len(normalized_answer), len(normalized_guess))
+        longer = max(len(normalized_answer), len(normalized_guess))
+        if longer and shorter / longer >= 0.6:
+            return True
+
+    answer_words = [w for w in normalized_answer.split(' ') if len(w) > 2]
+    guess_words = [w for w in normalized_guess.split(' ') if len(w) > 2]
+
+    if answer_words and guess_words:
+        matching = [
+            w for w in answer_words
+            if any(g == w or g in w or w in g for g in guess_words)
+        ]
+        if len(matching) / len(answer_words) >= 0.7:
+            return True
+
+    return False
+
+
+def frontend_keywords(text):
+    return [
+        w for w in text.split(' ')
+        if len(w) >= 3 and w not in FRONTEND_COMMON_WORDS and not _NUMBER.match(w)
+    ]
+
+
+def levenshtein(a, b):
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            if ca == cb:
+                current.append(previous[j - 1])
+            else:
+                current.append(min(previous[j - 1], current[j - 1], previous[j]) + 1)
+        previous = current
+    return previous[-1]
+
+
+def similarity(a, b):
+    longer, shorter = (a, b) if len(a) > len(b) else (b, a)
+    if not longer:
+        return 1.0
+    return (len(longer) - levenshtein(longer, shorter)) / len(longer)
+
+
+def frontend_words_match(answer_word, guess_word, similarity=similarity):
+    if guess_word == answer_word:
+        return True
+    if len(answer_word) >= 4 and len(guess_word) >= 4:
+        if answer_word in guess_word or guess_word in answer_word:
+            return True
+    if len(answer_word) >= 5 and len(guess_word) >= 5:
+        return similarity(answer_word, guess_word) >= 0.85
+    return False
+
+
+def frontend_check(answer, guess, similarity=similarity):
+    normalized_guess = frontend_normalize(guess)
+    normalized_answer = frontend_normalize(answer)
+
+    if normalized_guess == normalized_answer:
+        return True
+
+    answer_words = frontend_keywords(normalized_answer)
+    guess_words = frontend_keywords(normalized_guess)
+
+    if len(guess_words) < len(answer_words):
+        return False
+
+    return all(
+        any(frontend_words_match(a, g, similarity) for g in guess_words)
+        for a in answer_words
+    )
+
+
+MATCHERS = {
+    'backend': (backend_normalize, backend_check),
+    'frontend': (frontend_normalize, frontend_check),
+}
@@ -0,0 +1,174 @@
+"""Persistent memoization of matcher results across tool runs.
+
+Per-question results (such as a question's aliases, keyed by its content
+hash), word similarity scores and full matcher decisions are stored in
+``bank-store/memo.db`` under a hash of their inputs and of
+``hintbank/matching.py`` itself, so editing the matcher ports invalidates
+everything they produced; callers add a digest of their own rules to the
+inputs. Normalizing a string is cheaper than looking it up, so normalized
+forms are not stored. Callers ``preload`` the kinds they use in one query;
+after that, unchanged questions are a dictionary lookup and only new or
+edited ones are computed.
+
+The cache keeps at most ``max_entries`` results (200,000 by default) and
+evicts the least recently used ones whenever a run flushes it.
+
+    python3 -m hintbank.memo stats
+    python3 -m hintbank.memo clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from . import matching
+from .bank import ROOT, file_digest
+
+DEFAULT_CACHE = os.path.join(ROOT, 'bank-store', 'memo.db')
+DEFAULT_MAX_ENTRIES = 200_000
+
+# Results are only valid for the matcher code that produced them
+MATCHING_VERSION = file_digest(matching.__file__)[:16]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo (
+    key BLOB PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS memo_used ON memo (used);
+"""
+
+
+class MemoCache:
+    def __init__(self, path=DEFAULT_CACHE, max_entries=DEFAULT_MAX_ENTRIES):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        self.max_entries = max_entries
+        self.local = {}
+        self.stored = set()
+        self.preloaded = set()
+        self.pending = {}
+        self.touched = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def preload(self, *kinds):
+        # One query per run instead of one per lookup
+        kinds = [kind for kind in kinds if kind not in self.preloaded]
+        if not kinds:
+            return
+        rows = self.db.execute(
+            f"SELECT key, value FROM memo WHERE kind IN ({', '.join('?' * len(kinds))})", kinds
+        )
+        for key, value in rows:
+            self.local[key] = json.loads(value)
+            self.stored.add(key)
+        self.preloaded.update(kinds)
+
+    def get(self, kind, args, compute):
+        key = hashlib.sha256('\0'.join((kind, MATCHING_VERSION) + args).encode('utf-8')).digest()[:16]
+        if key in self.local:
+            self.hits += 1
+            if key in self.stored:
+                self.touched.add(key)
+            return self.local[key]
+
+        row = None
+        if kind not in self.preloaded:
+            row = self.db.execute('SELECT value FROM memo WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            value = json.loads(row[0])
+            self.stored.add(key)
+            self.touched.add(key)
+            self.hits += 1
+        else:
+            value = compute(*args)
+            self.pending[key] = (kind, value)
+            self.misses += 1
+
+        self.local[key] = value
+        return value
+
+    def similarity(self, a, b):
+        # Symmetric, so both orders share one entry
+        return self.get('similarity', tuple(sorted((a, b))), matching.similarity)
+
+    def check(self, matcher, answer, guess):
+        def compute(matcher, answer, guess):
+            if matcher == 'frontend':
+                # Word scores are shared between every pair that uses them
+                return matching.frontend_check(answer, guess, self.similarity)
+            return matching.MATCHERS[matcher][1](answer, guess)
+
+        return self.get('check', (matcher, answer, guess), compute)
+
+    def matcher(self, name):
+        """Memoized ``(normalize, check)`` pair with the ``MATCHERS`` signatures."""
+        return (
+            matching.MATCHERS[name][0],
+            lambda answer, guess: self.check(name, answer, guess),
+        )
+
+    def flush(self):
+        now = time.time()
+        with self.db:
+            self.db.executemany(
+                'INSERT OR REPLACE INTO memo (key, kind, value, used) VALUES (?, ?, ?, ?)',
+                [(key, kind, json.dumps(value), now) for key, (kind, value) in self.pending.items()],
+            )
+            self.db.executemany('UPDATE memo SET used = ? WHERE key = ?', [(now, key) for key in self.touched])
+            self.evict()
+        self.stored.update(self.pending)
+        self.pending.clear()
+        self.touched.clear()
+
+    def evict(self):
+        count, = self.db.execute('SELECT COUNT(*) FROM memo').fetchone()
+        if count > self.max_entries:
+            self.db.execute(
+                'DELETE FROM memo WHERE key IN (SELECT key FROM memo ORDER BY used LIMIT ?)',
+                (count - self.max_entries,),
+            )
+        return max(0, count - self.max_entries)
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['stats', 'clear'])
+    parser.add_argument('--cache', default=DEFAULT_CACHE)
+    args = parser.parse_args()
+
+    with MemoCache(args.cache) as memo:
+        if args.command == 'clear':
+            with memo.db:
+                memo.db.execute('DELETE FROM memo')
+            memo.db.execute('VACUUM')
+            print(f"Cleared {args.cache}")
+            return
+
+        rows = memo.db.execute("""
+            SELECT kind, COUNT(*), SUM(LENGTH(value)) FROM memo GROUP BY kind ORDER BY kind
+        """).fetchall()
+        for kind, count, size in rows:
+            print(f"{kind:<12} {count:>8} entries  {size:>10} bytes")
+        print(f"{os.path.getsize(args.cache):,} bytes on disk, limit {memo.max_entries:,} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Export Walker alias tables for stratified question selection.
+
+Questions are grouped into strata by (category, difficulty). Each stratum
+gets a weight of ``size ** alpha``: 1 draws every question equally often,
+0 draws every stratum equally often, and the default 0.5 sits in between
+so small categories are not drowned out by large ones. The output,
+``questions.sampling.json``, holds:
+
+``strata``  category, difficulty, weight and question ids of every stratum
+``tables``  alias tables over the strata, one for the whole bank (key
+            ``""``) and one per category: stratum indexes, ``prob`` and
+            ``alias``
+
+A draw picks a column uniformly, keeps it with probability ``prob`` or
+takes its alias, then picks a question uniformly from that stratum's unused
+ids. Marking a question used swap-removes it from its stratum, and a stratum
+is accepted with probability ``unused / size``, so freshness is accounted
+for without rebuilding the table. ``AliasSampler`` below is the reference
+implementation; ``frontend/src/services/QuestionSampler.js`` mirrors it.
+"""
+
+import argparse
+import random
+
+from .bank import BANKS, artifact_path, file_digest, load_bank, write_artifact
+
+SAMPLING_VERSION = 1
+
+# Consecutive rejected draws before checking whether anything is left
+MAX_REJECTS = 64
+
+
+def alias_table(weights):
+    # Vose's method: O(k) to build, O(1) per draw
+    count = len(weights)
+    total = sum(weights)
+    scaled = [w * count / total for w in weights]
+    prob = [1.0] * count
+    alias = list(range(count))
+
+    small = [i for i, p in enumerate(scaled) if p < 1]
+    large = [i for i, p in enumerate(scaled) if p >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1 - scaled[less]
+        (small if scaled[more] < 1 else large).append(more)
+
+    return prob, alias
+
+
+def build_tables(questions, alpha=0.5):
+    groups = {}
+    for question in questions:
+        groups.setdefault((question['category'], question['difficulty']), []).append(question['id'])
+
+    strata = [
+        {'category': category, 'difficulty': difficulty, 'weight': round(len(ids) ** alpha, 6), 'ids': ids}
+        for (category, difficulty), ids in sorted(groups.items())
+    ]
+
+    members = {'': list(range(len(strata)))}
+    for index, stratum in enumerate(strata):
+        members.setdefault(stratum['category'], []).append(index)
+
+    tables = {}
+    for key, indexes in members.items():
+        prob, alias = alias_table([strata[i]['weight'] for i in indexes])
+        tables[key] = {'strata': indexes, 'prob': [round(p, 8) for p in prob], 'alias': alias}
+
+    return {'version': SAMPLING_VERSION, 'alpha': alpha, 'strata': strata, 'tables': tables}
+
+
+class AliasSampler:
+    def __init__(self, data, rng=None):
+        self.rng = rng or random.Random()
+        self.strata = data['strata']
+        self.tables = data['tables']
+        self.reset()
+
+    def reset(self):
+        self.pools = [list(stratum['ids']) for stratum in self.strata]
+        self.where = {
+            qid: (index, position)
+            for index, pool in enumerate(self.pools)
+            for position, qid in enumerate(pool)
+        }
+        self.used = 0
+
+    def mark_used(self, qid):
+        if qid not in self.where:
+            return False
+        index, position = self.where.pop(qid)
+        pool = self.pools[index]
+        last = pool.pop()
+        if last != qid:
+            pool[position] = last
+            self.where[last] = (index, position)
+        self.used += 1
+        return True
+
+    def remaining(self, category=None):
+        return sum(len(self.pools[i]) for i in self.tables[category or '']['strata'])
+
+    def draw(self, category=None):
+        """Id of an unused question, or None when the table has none left."""
+        table = self.tables.get(category or '')
+        if table is None:
+            return None
+
+        rng = self.rng
+        rejects = 0
+        while True:
+            column = int(rng.random() * len(table['prob']))
+            if rng.random() >= table['prob'][column]:
+                column = table['alias'][column]
+            index = table['strata'][column]
+
+            pool = self.pools[index]
+            if pool and rng.random() * len(self.strata[index]['ids']) < len(pool):
+                return pool[int(rng.random() * len(pool))]
+
+            rejects += 1
+            if rejects >= MAX_REJECTS:
+                if self.remaining(category) == 0:
+                    return None
+                rejects = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('banks', nargs='*', default=list(BANKS), help='backend, frontend or a path')
+    parser.add_argument('--alpha', type=float, default=0.5, help='stratum weight exponent (default 0.5)')
+    args = parser.parse_args()
+
+    for bank in args.banks:
+        data = build_tables(load_bank(bank), args.alpha)
+        data['source'] = file_digest(bank)[:16]
+        output = artifact_path(bank, 'sampling.json')
+        write_artifact(output, data)
+        print(f"{output}: {len(data['strata'])} strata, {len(data['tables'])} tables")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Full-text search over answers and hints for editorial work.
+
+Keeps an SQLite database with an FTS5 index over every catalog. ``update``
+only rewrites questions whose content hash changed, so refreshing after an
+edit is cheap even for very large banks; ``query`` runs a ranked search.
+
+    python3 -m hintbank.search update
+    python3 -m hintbank.search query "mediterranean cuisine" --category Food
+    python3 -m hintbank.search query --raw 'answer: newt*'
+
+Plain queries match every word as typed; ``--raw`` passes FTS5 query syntax
+(column filters, prefixes, ``OR``, ``NEAR``) through unchanged.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+
+from .bank import BANKS, ROOT, load_bank, question_digest
+
+DEFAULT_DATABASE = os.path.join(ROOT, 'bank-store', 'search.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    rowid INTEGER PRIMARY KEY,
+    bank TEXT NOT NULL,
+    id TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    category TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    hints TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    UNIQUE (bank, id)
+);
+CREATE INDEX IF NOT EXISTS questions_category ON questions (category, difficulty);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5(
+    answer, hints, content='questions', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+-- Keep the external-content index in step with the table
+CREATE TRIGGER IF NOT EXISTS questions_ai AFTER INSERT ON questions BEGIN
+    INSERT INTO questions_fts (rowid, answer, hints) VALUES (new.rowid, new.answer, new.hints);
+END;
+CREATE TRIGGER IF NOT EXISTS questions_ad AFTER DELETE ON questions BEGIN
+    INSERT INTO questions_fts (questions_fts, rowid, answer, hints) VALUES ('delete', old.rowid, old.answer, old.hints);
+END;
+CREATE TRIGGER IF NOT EXISTS questions_au AFTER UPDATE ON questions BEGIN
+    INSERT INTO questions_fts (questions_fts, rowid, answer, hints) VALUES ('delete', old.rowid, old.answer, old.hints);
+    INSERT INTO questions_fts (rowid, answer, hints) VALUES (new.rowid, new.answer, new.hints);
+END;
+"""
+
+
+def connect(path=DEFAULT_DATABASE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def update(db, name, questions):
+    known = dict(db.execute('SELECT id, hash FROM questions WHERE bank = ?', (name,)))
+
+    rows = []
+    seen = set()
+    for q in questions:
+        seen.add(q['id'])
+        digest = question_digest(q)
+        if known.get(q['id']) != digest:
+            # Hints are stored one per line so snippets stay readable
+            rows.append((name, q['id'], q['answer'], q['category'], q['difficulty'],
+                         '\n'.join(q.get('hints', [])), digest))
+    removed = [(name, qid) for qid in known if qid not in seen]
+
+    with db:
+        db.executemany("""
+            INSERT INTO questions (bank, id, answer, category, difficulty, hints, hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (bank, id) DO UPDATE SET
+                answer = excluded.answer, category = excluded.category,
+                difficulty = excluded.difficulty, hints = excluded.hints, hash = excluded.hash
+        """, rows)
+        db.executemany('DELETE FROM questions WHERE bank = ? AND id = ?', removed)
+
+    return len(rows), len(removed)
+
+
+def quote_terms(text):
+    # "newton's law" -> "newton's" "law", so punctuation is never FTS5 syntax
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+
+def search(db, text, bank=None, category=None, difficulty=None, limit=20):
+    sql = """
+        SELECT q.bank, q.id, q.answer, q.category, q.difficulty,
+               snippet(questions_fts, 1, '[', ']', '…', 12)
+        FROM questions_fts
+        JOIN questions q ON q.rowid = questions_fts.rowid
+        WHERE questions_fts MATCH ?
+    """
+    params = [text]
+    for column, value in (('bank', bank), ('category', category), ('difficulty', difficulty)):
+        if value:
+            sql += f" AND q.{column} = ?"
+            params.append(value)
+    sql += ' ORDER BY bm25(questions_fts, 4.0, 1.0) LIMIT ?'
+    params.append(limit)
+    return db.execute(sql, params).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database', default=DEFAULT_DATABASE)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    update_parser = commands.add_parser('update', help='index new and changed questions')
+    update_parser.add_argument('banks', nargs='*', default=list(BANKS), help='backend, frontend or a path')
+
+    query_parser = commands.add_parser('query', help='ranked full-text search')
+    query_parser.add_argument('text')
+    query_parser.add_argument('--raw', action='store_true', help='use FTS5 query syntax as given')
+    query_parser.add_argument('--bank')
+    query_parser.add_argument('--category')
+    query_parser.add_argument('--difficulty')
+    query_parser.add_argument('--limit', type=int, default=20)
+    query_parser.add_argument('--json', action='store_true', help='print results as JSON')
+
+    args = parser.parse_args()
+    db = connect(args.database)
+
+    if args.command == 'update':
+        for bank in args.banks:
+            name = bank if bank in BANKS else os.path.splitext(os.path.basename(bank))[0]
+            changed, removed = update(db, name, load_bank(bank))
+            print(f"{name}: {changed} indexed, {removed} removed")
+        return
+
+    text = args.text if args.raw else quote_terms(args.text)
+    if not text.strip():
+        parser.error('empty query')
+    try:
+        results = search(db, text, args.bank, args.category, args.difficulty, args.limit)
+    except sqlite3.OperationalError as error:
+        parser.error(f"invalid query: {error}")
+    if args.json:
+        keys = ('bank', 'id', 'answer', 'category', 'difficulty', 'snippet')
+        print(json.dumps([dict(zip(keys, row)) for row in results], ensure_ascii=False, indent=2))
+        return
+    for bank, qid, answer, category, difficulty, snippet in results:
+        print(f"{bank:<9} {qid:<7} {answer} ({category}, {difficulty})")
+        print(f"          {snippet.replace(chr(10), ' / ')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Analyze the room snapshots GameManager keeps in Redis.
+
+Walks every ``room:*`` and ``survival:*`` key with ``SCAN``, reads them in
+pipelined batches and reports snapshot sizes, how much the id-only format
+saves over embedding full questions, and rooms that are stale (dealt from a
+different bank version, or still in the old embedded format) or abandoned.
+Requires the ``redis`` package.
+
+    python3 -m hintbank.snapshots --url redis://localhost:6379
+"""
+
+import argparse
+import json
+import time
+
+import redis
+
+from .bank import bank_hash, load_bank
+
+PATTERNS = ('room:*', 'survival:*')
+
+
+def scan_snapshots(client, batch):
+    for pattern in PATTERNS:
+        keys = []
+        for key in client.scan_iter(match=pattern, count=batch):
+            keys.append(key)
+            if len(keys) >= batch:
+                yield from read_batch(client, keys)
+                keys = []
+        if keys:
+            yield from read_batch(client, keys)
+
+
+def read_batch(client, keys):
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.hgetall(key)
+        pipe.ttl(key)
+    replies = pipe.execute()
+    for key, fields, ttl in zip(keys, replies[::2], replies[1::2]):
+        if fields:
+            yield key, fields, ttl
+
+
+def field_bytes(fields):
+    return sum(len(name) + len(value) for name, value in fields.items())
+
+
+def reference_bytes(fields):
+    return sum(len(name) + len(fields.get(name, b'')) for name in (b'questionIds', b'bankVersion'))
+
+
+def analyze(key, fields, ttl, bank, version, abandoned_after):
+    size = field_bytes(fields)
+    entry = {
+        'key': key.decode(),
+        'state': fields.get(b'gameState', b'?').decode(),
+        'bytes': size,
+        'ttl': ttl,
+    }
+
+    if b'questionIds' in fields:
+        ids = json.loads(fields[b'questionIds'])
+        questions = json.dumps([bank[i] for i in ids if i in bank], ensure_ascii=False, separators=(',', ':')).encode()
+        entry['format'] = 'ids'
+        entry['compact_bytes'] = size
+        entry['embedded_bytes'] = size - reference_bytes(fields) + len(b'questions') + len(questions)
+        entry['stale'] = fields.get(b'bankVersion', b'').decode() != version or any(i not in bank for i in ids)
+    else:
+        ids = [q.get('id') for q in json.loads(fields.get(b'questions', b'[]'))]
+        references = {b'questionIds': json.dumps(ids, separators=(',', ':')).encode(), b'bankVersion': version.encode()}
+        entry['format'] = 'embedded'
+        entry['embedded_bytes'] = size
+        # What the same snapshot costs once saved in the id-only format
+        entry['compact_bytes'] = (size - len(b'questions') - len(fields.get(b'questions', b''))
+                                  + reference_bytes(references))
+        entry['stale'] = True
+
+    created = int(fields.get(b'createdAt', b'0') or 0) / 1000
+    entry['age_min'] = (time.time() - created) / 60 if created else None
+    entry['abandoned'] = (
+        entry['state'] == 'finished'
+        or (entry['age_min'] is not None and entry['age_min'] > abandoned_after)
+    )
+    return entry
+
+
+def print_summary(entries):
+    def total(name, rows=entries):
+        return sum(row[name] for row in rows)
+
+    print(f"{'format':<10} {'rooms':>7} {'stored bytes':>13} {'embedded':>11} {'id-only':>11}")
+    for fmt in ('ids', 'embedded'):
+        rows = [row for row in entries if row['format'] == fmt]
+        print(f"{fmt:<10} {len(rows):>7} {total('bytes', rows):>13} {total('embedded_bytes', rows):>11} "
+              f"{total('compact_bytes', rows):>11}")
+
+    embedded, compact = total('embedded_bytes'), total('compact_bytes')
+    if embedded:
+        print(f"\nId-only snapshots: {compact} of {embedded} bytes ({1 - compact / embedded:.0%} saved)")
+    print(f"Stale rooms: {sum(row['stale'] for row in entries)}")
+    print(f"Abandoned rooms: {sum(row['abandoned'] for row in entries)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='redis://localhost:6379')
+    parser.add_argument('--bank', default='backend', help='bank the server is running with')
+    parser.add_argument('--batch', type=int, default=500, help='keys per SCAN page and pipeline')
+    parser.add_argument('--abandoned-after', type=float, default=60, help='minutes before a room counts as abandoned')
+    parser.add_argument('--list', action='store_true', help='print every stale or abandoned room')
+    args = parser.parse_args()
+
+    questions = load_bank(args.bank)
+    bank = {q['id']: q for q in questions}
+    version = bank_hash(questions)
+
+    client = redis.Redis.from_url(args.url)
+    entries = [
+        analyze(key, fields, ttl, bank, version, args.abandoned_after)
+        for key, fields, ttl in scan_snapshots(client, args.batch)
+    ]
+
+    print_summary(entries)
+    if args.list:
+        for row in entries:
+            if row['stale'] or row['abandoned']:
+                age = f"{row['age_min']:.0f}m" if row['age_min'] is not None else '?'
+                print(f"{row['key']:<32} {row['state']:<9} {row['format']:<9} age {age:>6} ttl {row['ttl']:>5}"
+                      f"{'  stale' if row['stale'] else ''}{'  abandoned' if row['abandoned'] else ''}")
+
+
+if __name__ == "__main__":
+    main()
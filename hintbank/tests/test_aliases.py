@@ -0,0 +1,84 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from hintbank import aliases as alias_rules
+from hintbank.aliases import _ARTICLE, build_alias_index, canonical_forms, common_words, looks_like_person, surname
+from hintbank.bank import BANKS, artifact_path, load_bank
+from hintbank.matching import MATCHERS, fold_accents
+from hintbank.memo import MemoCache
+
+
+def question(answer, first_hint):
+    return {'id': 'q0', 'answer': answer, 'category': 'Art', 'difficulty': 'easy', 'hints': [first_hint]}
+
+
+class PersonTest(unittest.TestCase):
+    def test_people(self):
+        self.assertTrue(looks_like_person(question('Frida Kahlo', 'This Mexican artist was known for her self-portraits')))
+        self.assertTrue(looks_like_person(question('Mark Twain', 'American humorist born Samuel Langhorne Clemens')))
+
+    def test_works_and_concepts(self):
+        self.assertFalse(looks_like_person(question('The Night Watch', 'Painted in 1642 during Dutch Golden Age')))
+        self.assertFalse(looks_like_person(question('Almond Blossoms', 'This Van Gogh painting celebrates new life')))
+        self.assertFalse(looks_like_person(question('Conceptual Art', 'Pioneered by Sol LeWitt with his wall drawings')))
+        self.assertFalse(looks_like_person(question('Tony Award', 'Named after actress and director Antoinette Perry')))
+
+    def test_surname_skips_suffixes(self):
+        self.assertEqual(surname('Martin Luther King Jr.'), 'King')
+        self.assertEqual(surname('Leonardo da Vinci'), 'da Vinci')
+
+    def test_common_word_surnames_are_dropped(self):
+        q = question('Muddy Waters', 'Born McKinley Morganfield in Mississippi Delta')
+        self.assertNotIn('Waters', canonical_forms(q, common={'waters'}))
+        self.assertIn('Waters', canonical_forms(q))
+
+
+class ShippedIndexTest(unittest.TestCase):
+    def test_no_surname_alias_is_a_common_word(self):
+        for name in BANKS:
+            normalize, _ = MATCHERS[name]
+            questions = load_bank(name)
+            common = common_words(questions)
+            # A common word is still fine when it is a whole answer
+            answers = {
+                normalize(fold_accents(form))
+                for q in questions for form in (q['answer'], _ARTICLE.sub('', q['answer']))
+            }
+            with open(artifact_path(name, 'aliases.json'), 'r', encoding='utf-8') as f:
+                aliases = json.load(f)['aliases']
+
+            offending = sorted(alias for alias in aliases if alias in common and alias not in answers)
+            self.assertEqual(offending, [], name)
+
+
+class CachedIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.questions = load_bank('backend')[:200]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def build(self):
+        with MemoCache(os.path.join(self.tmp, 'memo.db')) as memo:
+            return build_alias_index(self.questions, 'backend', memo=memo)
+
+    def test_rule_change_rebuilds_cached_aliases(self):
+        cold = self.build()
+        self.assertEqual(self.build(), cold)
+
+        # Editing aliases.py changes its digest along with the rule
+        with mock.patch.object(alias_rules, 'MIN_ALIAS_LENGTH', 10), \
+                mock.patch.object(alias_rules, 'RULES_VERSION', 'edited'):
+            warm = self.build()
+            uncached = build_alias_index(self.questions, 'backend')
+        self.assertEqual(warm, uncached)
+        self.assertLess(len(warm), len(cold))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import json
+import os
+import unittest
+
+from hintbank.bank import BANKS, artifact_path, bank_hash, file_digest, load_bank
+from hintbank.compress import SHIPPED_ARTIFACTS
+
+
+class ShippedArtifactsTest(unittest.TestCase):
+    def test_artifacts_match_their_catalog(self):
+        # The frontend imports its artifacts at build time without checking them
+        for name in BANKS:
+            source = file_digest(name)[:16]
+            version = bank_hash(load_bank(name))
+            for suffix in SHIPPED_ARTIFACTS:
+                path = artifact_path(name, suffix)
+                if not os.path.exists(path):
+                    continue
+                with open(path, 'r', encoding='utf-8') as f:
+                    artifact = json.load(f)
+                # The lookup table is keyed by content hash rather than file digest
+                if 'bankVersion' in artifact:
+                    self.assertEqual(artifact['bankVersion'], version, f"{path} is stale; rebuild it from {name}")
+                else:
+                    self.assertEqual(artifact['source'], source, f"{path} is stale; rebuild it from {name}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import replace_hints
+
+from hintbank.bank import dump_bank, load_bank
+from hintbank.columnar import ColumnarBank
+
+
+def question(qid, answer, hints, **fields):
+    return dict({'id': qid, 'answer': answer, 'category': 'Physics', 'difficulty': 'hard', 'hints': hints}, **fields)
+
+
+class ColumnarBankTest(unittest.TestCase):
+    def setUp(self):
+        generic = list(replace_hints.generic_hints[:4]) + ['Specific fifth hint']
+        self.questions = [
+            question('q1', 'Quantum Mechanics', generic),
+            question('q2', 'Quantum Mechanics', generic, source='wiki', tags=['physics', None]),
+            {'id': 'q3', 'answer': 'Dark Matter', 'category': 'Physics', 'difficulty': 'hard', 'note': 'no hints yet'},
+            {'hints': ['Reordered keys'], 'id': 'q4', 'answer': 'Entropy', 'category': 'Physics', 'difficulty': 'easy'},
+        ]
+
+    def test_round_trip(self):
+        bank = ColumnarBank(self.questions)
+        self.assertEqual(bank.to_questions(), self.questions)
+        self.assertEqual(bank.hints(2), [])
+        self.assertEqual(list(bank.extras), [1, 2, 3])
+        self.assertEqual(len(bank.rows(category='Physics', difficulty='hard')), 3)
+
+    def test_replace_hints_keeps_other_fields(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        path = os.path.join(tmp, 'questions.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(dump_bank(self.questions))
+
+        with mock.patch.object(replace_hints, 'BACKEND_BANK', path), \
+                contextlib.redirect_stdout(io.StringIO()):
+            replace_hints.main()
+
+        expected = replace_hints.specific_hints['Quantum Mechanics'] + ['Specific fifth hint']
+        written = load_bank(path)
+        self.assertEqual([q['hints'] for q in written[:2]], [expected, expected])
+        self.assertEqual(written[1:], [dict(self.questions[1], hints=expected)] + self.questions[2:])
+        self.assertEqual([list(q) for q in written], [list(q) for q in self.questions])
+
+
+if __name__ == '__main__':
+    unittest.main()
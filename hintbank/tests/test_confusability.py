@@ -0,0 +1,48 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from hintbank import confusability
+from hintbank.bank import load_bank
+from hintbank.columnar import ColumnarBank
+
+
+class NearestTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        questions = load_bank('backend')[:120]
+        # The same answer again, worded differently: a duplicate, not a rival
+        questions.append(dict(questions[0], id='copy', answer=questions[0]['answer'].upper()))
+        cls.bank = ColumnarBank(questions)
+        cls.pruned = confusability.nearest(cls.bank, 64)
+        # Reading every posting and rescoring every candidate is exact
+        with mock.patch.object(confusability, 'POSTINGS', 10 ** 9), \
+                mock.patch.object(confusability, 'CANDIDATES', 10 ** 9):
+            cls.exact = confusability.nearest(cls.bank, 16)
+
+    def test_pruning_keeps_the_closest_rivals(self):
+        owners, own, rival, rival_score = self.pruned
+        _, exact_own, _, exact_score = self.exact
+        np.testing.assert_array_equal(own, exact_own)
+        self.assertTrue((rival_score <= exact_score + 1e-5).all())
+        self.assertGreater((rival_score >= exact_score - 1e-4).mean(), 0.95)
+        np.testing.assert_array_equal(rival_score - own > 0.2, exact_score - exact_own > 0.2)
+
+    def test_duplicates_are_never_rivals(self):
+        owners, _, rival, _ = self.pruned
+        group = confusability.duplicate_groups(self.bank)
+        found = rival >= 0
+        self.assertEqual(group[0], group[-1])
+        self.assertFalse((group[rival[found]] == group[owners[found]]).any())
+
+    def test_no_ngram_spans_two_texts(self):
+        texts = ['Quantum Mechanics', '', 'Schrödinger’s Cat', 'ab']
+        buckets, offsets = confusability.flat_buckets(texts, chunk=3)
+        for i, text in enumerate(texts):
+            _, alone = confusability.ngram_buckets([text])
+            self.assertEqual(sorted(buckets[offsets[i]:offsets[i + 1]]), sorted(alone))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import json
+import os
+import unittest
+
+from hintbank import golden
+
+
+class GoldenTest(unittest.TestCase):
+    def test_fixtures_match_their_snapshots(self):
+        fixtures = golden.fixture_paths()
+        self.assertTrue(fixtures)
+        empty = {'added': [], 'removed': [], 'changed': {}, 'reordered': False}
+        for fixture in fixtures:
+            with self.subTest(fixture=os.path.basename(fixture)):
+                self.assertTrue(os.path.exists(golden.golden_path(fixture)), 'no golden snapshot')
+                self.assertEqual(golden.check(fixture), empty)
+
+    def test_changed_hint_is_reported(self):
+        fixture = golden.fixture_paths()[0]
+        with open(golden.golden_path(fixture), 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        questions = golden.run_pipeline(golden.load_bank(fixture))
+        questions[0] = dict(questions[0], hints=['Edited'] + questions[0]['hints'][1:])
+
+        result = golden.compare(snapshot, questions)
+        self.assertEqual(list(result['changed']), [questions[0]['id']])
+        self.assertEqual(result['changed'][questions[0]['id']][0][0], 'hints[0]')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import contextlib
+import copy
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import replace_hints
+
+from hintbank import journal
+from hintbank.bank import BACKEND_BANK, bank_hash, load_bank, save_bank
+
+
+class JournalTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'questions.json')
+        shutil.copy(BACKEND_BANK, self.path)
+        self.original = load_bank(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def edited(self, questions, hint):
+        questions = copy.deepcopy(questions)
+        questions[0]['hints'][0] = hint
+        return questions
+
+    def test_write_checkout_and_rollback(self):
+        first = self.edited(self.original, 'first edit')
+        second = self.edited(first, 'second edit')
+        self.assertEqual(save_bank(self.path, first, 'one'), 0)
+        self.assertEqual(save_bank(self.path, second, 'two'), 1)
+        self.assertIsNone(save_bank(self.path, second, 'unchanged'))
+
+        self.assertEqual(bank_hash(journal.checkout(self.path, 0)), bank_hash(first))
+        self.assertEqual(bank_hash(journal.checkout(self.path, -1)), bank_hash(self.original))
+
+        self.assertEqual(journal.rollback(self.path, 0), 2)
+        self.assertEqual(bank_hash(load_bank(self.path)), bank_hash(first))
+        self.assertEqual(journal.read_entry(self.path, 2)['reason'], 'rollback to 0')
+
+    def test_unknown_entries_are_rejected(self):
+        save_bank(self.path, self.edited(self.original, 'only entry'), 'one')
+        for seq in (1, 999, -2):
+            with self.assertRaises(ValueError):
+                journal.checkout(self.path, seq)
+            with self.assertRaises(ValueError):
+                journal.rollback(self.path, seq)
+        self.assertEqual(journal.entry_count(self.path), 1)
+
+    def test_recover_finishes_interrupted_write(self):
+        target = self.edited(self.original, 'journaled but not written')
+        with journal.bank_lock(self.path, recover=False):
+            journal._journal(self.path, self.original, target, 'crash')
+
+        self.assertEqual(journal.recover(self.path), 0)
+        self.assertEqual(bank_hash(load_bank(self.path)), bank_hash(target))
+        self.assertIsNone(journal.recover(self.path))
+
+    def test_locked_load_sees_pending_entry(self):
+        # A caller that loads under the lock must not overwrite a pending entry
+        target = self.edited(self.original, 'pending edit')
+        with journal.bank_lock(self.path, recover=False):
+            journal._journal(self.path, self.original, target, 'crash')
+
+        with mock.patch.object(replace_hints, 'BACKEND_BANK', self.path), \
+                contextlib.redirect_stdout(io.StringIO()):
+            replace_hints.main()
+
+        self.assertEqual(bank_hash(load_bank(self.path)), bank_hash(target))
+        self.assertEqual(journal.entry_count(self.path), 1)
+
+    def test_nested_lock(self):
+        edited = self.edited(self.original, 'nested')
+        with journal.bank_lock(self.path):
+            with journal.bank_lock(self.path):
+                questions = load_bank(self.path)
+            self.assertEqual(save_bank(self.path, edited, 'inner write'), 0)
+            self.assertIn(os.path.abspath(self.path), journal._held)
+        self.assertNotIn(os.path.abspath(self.path), journal._held)
+        self.assertEqual(bank_hash(questions), bank_hash(self.original))
+        self.assertEqual(bank_hash(load_bank(self.path)), bank_hash(edited))
+
+    def test_hand_edit_is_folded_into_next_write(self):
+        save_bank(self.path, self.edited(self.original, 'journaled'), 'one')
+        hand = self.edited(self.original, 'by hand')
+        journal.atomic_write(self.path, hand)
+
+        self.assertIsNone(journal.recover(self.path))
+        final = self.edited(hand, 'after hand edit')
+        save_bank(self.path, final, 'two')
+        self.assertEqual(bank_hash(journal.checkout(self.path, 0)), bank_hash(hand))
+        with self.assertRaises(ValueError):
+            journal.checkout(self.path, -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
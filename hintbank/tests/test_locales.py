@@ -0,0 +1,72 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from hintbank import journal, locales
+from hintbank.bank import load_bank
+from hintbank.columnar import ColumnarBank
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', 'locales')
+TABLES = os.path.join(FIXTURES, 'tables')
+
+
+class LocaleKeyTest(unittest.TestCase):
+    def test_articles(self):
+        french = locales.article_pattern(locales.ARTICLES['fr'])
+        self.assertEqual(locales.locale_key("L'Étranger", french), 'etranger')
+        self.assertEqual(locales.locale_key('Les Misérables', french), 'miserables')
+        self.assertEqual(locales.locale_key('Le Rouge et le Noir', french), 'rouge et le noir')
+        # Only whole leading words are articles
+        self.assertEqual(locales.locale_key('Lesotho', french), 'lesotho')
+
+    def test_english_matches_exactly(self):
+        key = locales.table_key('en', locales.load_table('en'))
+        self.assertEqual(key('The Stranger'), 'The Stranger')
+
+
+class ProcessLocaleTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.data = os.path.join(self.tmp, 'data')
+        shutil.copytree(os.path.join(FIXTURES, 'data'), self.data)
+        self.bank = os.path.join(self.data, 'locales', 'fr', 'questions.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_report(self):
+        report, = locales.run(['fr'], self.data, TABLES, workers=1)
+        self.assertEqual(report['missing'], ['q4'])
+        self.assertEqual(report['extra'], ['q9'])
+        self.assertEqual(report['unmatched'], ['Le Rouge et le Noir'])
+        self.assertEqual(report['collisions'], ["Etranger (same key as L'Étranger)"])
+        self.assertEqual((report['replaced'], report['uncovered'], report['written']), (2, 1, False))
+        self.assertEqual(journal.entry_count(self.bank), 0)
+
+    def test_write(self):
+        report, = locales.run(['fr'], self.data, TABLES, write=True, workers=1)
+        self.assertTrue(report['written'])
+
+        table = locales.load_table('fr', TABLES)
+        questions = {q['id']: q for q in load_bank(self.bank)}
+        self.assertEqual(questions['q1']['hints'],
+                         table['specific_hints']["L'Étranger"] + ['Se déroule en Algérie française'])
+        self.assertEqual(questions['q2']['hints'], table['specific_hints']['Les Miserables'])
+        self.assertEqual(journal.read_entry(self.bank, 0)['reason'], 'hintbank.locales (fr)')
+
+    def test_bank_is_loaded_under_the_lock(self):
+        held = []
+
+        def load(path):
+            held.append(os.path.abspath(path) in journal._held)
+            return ColumnarBank(load_bank(path))
+
+        with mock.patch.object(locales.ColumnarBank, 'load', side_effect=load):
+            locales.process_locale('fr', self.bank, locales.load_table('fr', TABLES), set(), write=True)
+        self.assertEqual(held, [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
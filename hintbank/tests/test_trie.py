@@ -0,0 +1,43 @@
+import json
+import unittest
+
+from hintbank.bank import artifact_path
+from hintbank.trie import LEADING_WORDS, answer_key, prefix_keys, suggest
+
+
+class SuggestTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open(artifact_path('frontend', 'trie.json'), 'r', encoding='utf-8') as f:
+            cls.trie = json.load(f)
+
+    def test_trailing_preposition_is_pending(self):
+        for text in ('battle of', 'battle of ', 'battle o', 'battle of w'):
+            self.assertIn('Battle of Waterloo', suggest(self.trie, text), text)
+        self.assertEqual(suggest(self.trie, 'lord of the r'), ['Lord of the Rings'])
+
+    def test_finished_leading_article_is_dropped(self):
+        self.assertEqual(suggest(self.trie, 'the '), [])
+        self.assertIn('The Sahara Desert', suggest(self.trie, 'the s'))
+        self.assertNotIn('Theater', suggest(self.trie, 'the s'))
+
+    def test_typographic_apostrophe(self):
+        self.assertEqual(suggest(self.trie, 'schrodinger’s'), ["Schrödinger's Cat"])
+        self.assertEqual(suggest(self.trie, 'Schrödinger’s c'), ["Schrödinger's Cat"])
+
+    def test_answers_stay_reachable_while_typed(self):
+        unreachable = []
+        for answer in self.trie['answers']:
+            key = answer_key(answer, 'frontend')
+            for end in range(1, len(answer) + 1):
+                typed = answer[:end]
+                # A leading article is only dropped once the next word starts
+                if any(word.startswith(typed.strip().lower()) for word in LEADING_WORDS):
+                    continue
+                if not any(key.startswith(prefix) for prefix in prefix_keys(typed, 'frontend')):
+                    unreachable.append(typed)
+        self.assertEqual(unreachable, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
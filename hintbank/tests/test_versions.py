@@ -0,0 +1,42 @@
+import copy
+import unittest
+
+from hintbank.bank import BACKEND_BANK, bank_hash, load_bank
+from hintbank.versions import apply_patch, make_patch
+
+
+class PatchTest(unittest.TestCase):
+    def setUp(self):
+        self.original = load_bank(BACKEND_BANK)[:20]
+
+    def round_trip(self, new):
+        patch = make_patch(self.original, new)
+        self.assertEqual(bank_hash(apply_patch(self.original, patch)), bank_hash(new))
+        self.assertEqual(bank_hash(apply_patch(new, make_patch(new, self.original))), bank_hash(self.original))
+        return patch
+
+    def test_null_value_is_not_a_deletion(self):
+        new = copy.deepcopy(self.original)
+        new[0]['category'] = None
+        new[1]['note'] = None
+        patch = self.round_trip(new)
+        self.assertEqual(patch['changed'][new[1]['id']], {'note': None})
+        self.assertEqual(patch['deleted'], {})
+
+    def test_deleted_field(self):
+        new = copy.deepcopy(self.original)
+        del new[2]['category']
+        new[3]['hints'] = new[3]['hints'][:1]
+        patch = self.round_trip(new)
+        self.assertEqual(patch['deleted'], {new[2]['id']: ['category']})
+        self.assertNotIn(new[2]['id'], patch['changed'])
+
+    def test_added_removed_and_reordered(self):
+        new = copy.deepcopy(self.original[1:])
+        new.reverse()
+        new.insert(3, dict(self.original[0], id='added-question'))
+        self.round_trip(new)
+
+
+if __name__ == '__main__':
+    unittest.main()
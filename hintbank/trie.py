@@ -0,0 +1,214 @@
+"""Build a compact prefix trie over normalized answers for autocomplete.
+
+The trie is path-compressed (runs of single-child nodes collapse into one
+edge label) and laid out breadth-first in flat arrays, so clients can load
+it with one ``JSON.parse`` and walk it without building objects:
+
+``labels``  all edge labels concatenated into one string
+``nodes``   ``NODE_FIELDS`` integers per node: label start, label length,
+            first child, child count, answer index (-1 if not terminal)
+``answers`` display answers, referenced by the answer index
+
+Children of a node are contiguous and sorted by label. Node 0 is the root.
+"""
+
+import argparse
+import re
+
+from .bank import BANKS, artifact_path, file_digest, load_bank, write_artifact
+from .matching import MATCHERS, fold_accents
+
+TRIE_VERSION = 1
+NODE_FIELDS = 5
+
+# The frontend normalization drops these only once another word follows
+LEADING_WORDS = ('the', 'a', 'an')
+INNER_WORDS = LEADING_WORDS + ('of', 'in', 'on', 'at', 'by', 'for', 'with')
+
+
+def answer_key(answer, matcher):
+    normalize, _ = MATCHERS[matcher]
+    return normalize(fold_accents(answer))
+
+
+def _pending(words):
+    return LEADING_WORDS if len(words) == 1 else INNER_WORDS
+
+
+def prefix_keys(text, matcher):
+    """Keys to complete partial input from, most specific first.
+
+    The frontend normalization only drops an article or preposition once
+    another word follows, so trailing ones are held back; a trailing word
+    that is only the start of one ("battle o") may also belong to the
+    answer, so the input is tried both with and without it.
+    ``AnswerTrie.keys`` mirrors this.
+    """
+    normalize, _ = MATCHERS[matcher]
+    text = fold_accents(text)
+    words = text.split()
+    if matcher != 'frontend' or not words:
+        keys = [normalize(text)]
+    else:
+        partial = None if text[-1].isspace() else words.pop()
+        while words and words[-1].lower() in _pending(words):
+            words.pop()
+        keys = [normalize(' '.join(words))]
+        if partial is not None:
+            pending = _pending(words + [partial])
+            if not any(word.startswith(partial.lower()) for word in pending):
+                keys = []
+            keys.insert(0, normalize(text))
+    return [key for i, key in enumerate(keys) if key and key not in keys[:i]]
+
+
+def category_slug(category):
+    return re.sub(r'[^a-z0-9]+', '-', category.lower()).strip('-')
+
+
+def build_trie(questions, matcher):
+    answers = []
+    root = {}
+    for question in questions:
+        key = answer_key(question['answer'], matcher)
+        if not key:
+            continue
+        node = root
+        for ch in key:
+            node = node.setdefault(ch, {})
+        # Duplicate answers across categories share one terminal
+        if '' not in node:
+            node[''] = len(answers)
+            answers.append(question['answer'])
+
+    labels = []
+    label_offsets = {}
+    nodes = []
+    size = 0
+
+    def add_label(label):
+        nonlocal size
+        if label not in label_offsets:
+            label_offsets[label] = size
+            labels.append(label)
+            size += len(label)
+        return label_offsets[label]
+
+    def compress(label, node):
+        # Follow single-child, non-terminal chains into one edge
+        while len(node) == 1 and '' not in node:
+            (ch, child), = node.items()
+            label += ch
+            node = child
+        return label, node
+
+    # Breadth-first layout keeps every node's children contiguous
+    queue = [('', root)]
+    nodes.extend([0, 0, 0, 0, -1])
+    head = 0
+    while head < len(queue):
+        _, node = queue[head]
+        base = head * NODE_FIELDS
+        children = sorted(compress(ch, child) for ch, child in node.items() if ch)
+        nodes[base + 2] = len(queue)
+        nodes[base + 3] = len(children)
+        nodes[base + 4] = node.get('', -1)
+        for label, child in children:
+            queue.append((label, child))
+            nodes.extend([add_label(label), len(label), 0, 0, -1])
+        head += 1
+
+    return {
+        'version': TRIE_VERSION,
+        'matcher': matcher,
+        'labels': ''.join(labels),
+        'nodes': nodes,
+        'answers': answers,
+    }
+
+
+def _find(trie, prefix):
+    labels, nodes = trie['labels'], trie['nodes']
+    node = 0
+    while prefix:
+        base = node * NODE_FIELDS
+        first, count = nodes[base + 2], nodes[base + 3]
+        for child in range(first, first + count):
+            start, length = nodes[child * NODE_FIELDS], nodes[child * NODE_FIELDS + 1]
+            if labels[start] != prefix[0]:
+                continue
+            label = labels[start:start + length]
+            if label.startswith(prefix):
+                return child
+            if not prefix.startswith(label):
+                return None
+            prefix = prefix[length:]
+            node = child
+            break
+        else:
+            return None
+    return node
+
+
+def has_prefix(trie, prefix):
+    return _find(trie, prefix) is not None
+
+
+def complete(trie, prefix, limit=10):
+    node = _find(trie, prefix)
+    if node is None:
+        return []
+
+    nodes = trie['nodes']
+    results = []
+    stack = [node]
+    while stack and len(results) < limit:
+        node = stack.pop()
+        base = node * NODE_FIELDS
+        if nodes[base + 4] >= 0:
+            results.append(trie['answers'][nodes[base + 4]])
+        first, count = nodes[base + 2], nodes[base + 3]
+        stack.extend(reversed(range(first, first + count)))
+    return results
+
+
+def suggest(trie, text, limit=10):
+    # What the autocomplete shows for raw input; see AnswerTrie.complete
+    results = []
+    for key in prefix_keys(text, trie['matcher']):
+        # Enough to make up for answers an earlier key already found
+        results.extend(answer for answer in complete(trie, key, limit + len(results)) if answer not in results)
+    return results[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('banks', nargs='*', default=list(BANKS), help='backend, frontend or a path')
+    parser.add_argument('--matcher', choices=sorted(MATCHERS), help='defaults to the bank name')
+    parser.add_argument('--by-category', action='store_true', help='also write one trie per category')
+    args = parser.parse_args()
+
+    for bank in args.banks:
+        matcher = args.matcher or (bank if bank in MATCHERS else 'backend')
+        questions = load_bank(bank)
+        source = file_digest(bank)[:16]
+
+        shards = {'': questions}
+        if args.by_category:
+            for question in questions:
+                shards.setdefault(question['category'], []).append(question)
+
+        for category, shard in shards.items():
+            trie = build_trie(shard, matcher)
+            trie['source'] = source
+            suffix = 'trie.json'
+            if category:
+                trie['category'] = category
+                suffix = f"trie.{category_slug(category)}.json"
+            output = artifact_path(bank, suffix)
+            write_artifact(output, trie)
+            print(f"{output}: {len(trie['nodes']) // NODE_FIELDS} nodes, {len(trie['answers'])} answers")
+
+
+if __name__ == "__main__":
+    main()
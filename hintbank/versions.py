@@ -0,0 +1,210 @@
+"""Content-addressed bank versions and per-question delta patches.
+
+Every snapshot is stored once under the hash of its canonical serialization,
+and consecutive snapshots are linked by a small patch listing the added,
+removed and changed questions. Anyone holding version N can reach N+1 with
+``apply_patch`` instead of downloading the whole catalog.
+
+Store layout (``bank-store/`` by default)::
+
+    objects/<hash>.json.gz          full canonical bank
+    patches/<from>-<to>.json.gz     delta between two versions
+    history/<bank>.json             ordered version hashes per bank
+"""
+
+import argparse
+import gzip
+import json
+import os
+
+from .bank import BANKS, ROOT, bank_hash, load_bank, save_bank
+
+DEFAULT_STORE = os.path.join(ROOT, 'bank-store')
+PATCH_VERSION = 2
+
+
+def _write_gz(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, path)
+
+
+def _read_gz(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def object_path(store, digest):
+    return os.path.join(store, 'objects', f"{digest}.json.gz")
+
+
+def patch_path(store, old, new):
+    return os.path.join(store, 'patches', f"{old}-{new}.json.gz")
+
+
+def history_path(store, name):
+    return os.path.join(store, 'history', f"{name}.json")
+
+
+def load_history(store, name):
+    try:
+        with open(history_path(store, name), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def load_version(store, digest):
+    return _read_gz(object_path(store, digest))
+
+
+def make_patch(old, new):
+    old_by_id = {q['id']: q for q in old}
+    new_by_id = {q['id']: q for q in new}
+
+    removed = [q['id'] for q in old if q['id'] not in new_by_id]
+    added = [[i, q] for i, q in enumerate(new) if q['id'] not in old_by_id]
+
+    changed = {}
+    deleted = {}
+    for q in new:
+        before = old_by_id.get(q['id'])
+        if before is None or before == q:
+            continue
+        # Only the fields that differ; deletions are listed apart, since
+        # null is a legitimate field value
+        delta = {k: v for k, v in q.items() if k not in before or before[k] != v}
+        gone = [k for k in before if k not in q]
+        # Re-added fields land at the end, and key order is part of the hash;
+        # ship the whole question when the patched order would differ
+        if [k for k in before if k in q] + [k for k in delta if k not in before] != list(q):
+            delta, gone = dict(q), list(before)
+        if delta:
+            changed[q['id']] = delta
+        if gone:
+            deleted[q['id']] = gone
+
+    patch = {
+        'version': PATCH_VERSION,
+        'from': bank_hash(old),
+        'to': bank_hash(new),
+        'removed': removed,
+        'added': added,
+        'changed': changed,
+        'deleted': deleted,
+    }
+
+    # Surviving questions normally keep their relative order; only ship the
+    # full id order when they were actually reshuffled
+    survivors = [q['id'] for q in old if q['id'] in new_by_id]
+    if survivors != [q['id'] for q in new if q['id'] in old_by_id]:
+        patch['order'] = [q['id'] for q in new]
+
+    return patch
+
+
+def apply_patch(questions, patch):
+    if patch['version'] != PATCH_VERSION:
+        raise ValueError(f"Unsupported patch version {patch['version']}; re-run snapshot to rebuild it")
+    if bank_hash(questions) != patch['from']:
+        raise ValueError(f"Patch expects version {patch['from'][:12]}")
+
+    removed = set(patch['removed'])
+    result = []
+    for q in questions:
+        if q['id'] in removed:
+            continue
+        delta = patch['changed'].get(q['id'])
+        gone = patch['deleted'].get(q['id'])
+        if delta or gone:
+            q = dict(q)
+            for key in gone or ():
+                q.pop(key, None)
+            q.update(delta or {})
+        result.append(q)
+
+    if 'order' in patch:
+        by_id = {q['id']: q for q in result}
+        by_id.update({q['id']: q for _, q in patch['added']})
+        result = [by_id[qid] for qid in patch['order']]
+    else:
+        for index, q in patch['added']:
+            result.insert(index, q)
+
+    if bank_hash(result) != patch['to']:
+        raise ValueError(f"Patched bank does not match version {patch['to'][:12]}")
+    return result
+
+
+def snapshot(bank, name, store=DEFAULT_STORE):
+    questions = load_bank(bank)
+    digest = bank_hash(questions)
+    history = load_history(store, name)
+    if history and history[-1] == digest:
+        return digest, None
+
+    if not os.path.exists(object_path(store, digest)):
+        _write_gz(object_path(store, digest), questions)
+
+    patch_file = None
+    if history:
+        previous = history[-1]
+        patch_file = patch_path(store, previous, digest)
+        _write_gz(patch_file, make_patch(load_version(store, previous), questions))
+
+    history.append(digest)
+    os.makedirs(os.path.dirname(history_path(store, name)), exist_ok=True)
+    with open(history_path(store, name), 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+
+    return digest, patch_file
+
+
+def upgrade(bank, name, store=DEFAULT_STORE):
+    # Walk the patch chain from the bank's current version to the latest one,
+    # holding the lock so no other write lands between the load and the save
+    from .journal import bank_lock
+
+    with bank_lock(bank):
+        questions = load_bank(bank)
+        history = load_history(store, name)
+        digest = bank_hash(questions)
+        if digest not in history:
+            raise ValueError(f"{bank} is not a stored version of {name}")
+
+        steps = history[history.index(digest):]
+        for old, new in zip(steps, steps[1:]):
+            questions = apply_patch(questions, _read_gz(patch_path(store, old, new)))
+
+        save_bank(bank, questions, f"upgrade to {history[-1][:12]}")
+    return len(steps) - 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['snapshot', 'upgrade', 'history'])
+    parser.add_argument('banks', nargs='*', default=list(BANKS), help='backend, frontend or a path')
+    parser.add_argument('--store', default=DEFAULT_STORE)
+    args = parser.parse_args()
+
+    for bank in args.banks:
+        name = bank if bank in BANKS else os.path.splitext(os.path.basename(bank))[0]
+
+        if args.command == 'snapshot':
+            digest, patch_file = snapshot(bank, name, args.store)
+            if patch_file:
+                print(f"{name}: {digest[:12]} (patch {os.path.getsize(patch_file)} bytes)")
+            else:
+                print(f"{name}: {digest[:12]}")
+        elif args.command == 'upgrade':
+            steps = upgrade(bank, name, args.store)
+            print(f"{name}: applied {steps} patches")
+        else:
+            for digest in load_history(args.store, name):
+                print(f"{name}: {digest[:12]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
-import json
+from hintbank.bank import BACKEND_BANK
+from hintbank.columnar import ColumnarBank
+from hintbank.journal import bank_lock
 
 # Dictionary mapping answers to their specific hints (first 4 hints, keeping the 5th if it exists)
 specific_hints = {
@@ -991,45 +993,60 @@ specific_hints = {
     ]
 }
 
-def main():
-    # Load the questions file
-    with open('/Users/mariana/code/loadsmile/hintman-game/backend/src/data/questions.json', 'r') as f:
-        questions = json.load(f)
+# Generic hints that should be replaced (the first one marks a question as generic)
+generic_hints = [
+    "Fundamental principle governing motion and forces",
+    "Key concept in understanding natural phenomena",
+    "Used in engineering and scientific applications",
+    "Essential for modern physics and technology"
+]
+
+def find_replacements(bank, table=None, generic=None, key=None):
+    # Map row -> new hints for every question still using the generic hints.
+    # Other locales pass their own tables and a function that keys answers
+    table = specific_hints if table is None else table
+    generic = generic_hints if generic is None else generic
+    generic_pattern = generic[0]
+    replacements = {}
+
+    # Find all questions with generic patterns by scanning the hint column
+    for row in range(len(bank)):
+        if bank.hint(row, 0) != generic_pattern:
+            continue
 
-    generic_pattern = 'Fundamental principle governing motion and forces'
-    replaced_count = 0
+        answer = bank.answers[row]
+        if key is not None:
+            answer = key(answer)
+        if answer not in table:
+            continue
 
-    # Find and replace all questions with generic patterns
-    for question in questions:
-        if ('hints' in question and
-            len(question['hints']) > 0 and
-            question['hints'][0] == generic_pattern and
-            question['answer'] in specific_hints):
+        # Get the specific hints for this answer
+        new_hints = table[answer].copy()
 
-            # Get the specific hints for this answer
-            new_hints = specific_hints[question['answer']].copy()
+        # Keep the 5th hint if it exists and is specific (not generic)
+        fifth_hint = bank.hint(row, 4)
+        if fifth_hint is not None and fifth_hint not in generic:
+            new_hints.append(fifth_hint)
 
-            # Keep the 5th hint if it exists and is specific (not generic)
-            if len(question['hints']) >= 5:
-                fifth_hint = question['hints'][4]
-                if fifth_hint not in [
-                    "Fundamental principle governing motion and forces",
-                    "Key concept in understanding natural phenomena",
-                    "Used in engineering and scientific applications",
-                    "Essential for modern physics and technology"
-                ]:
-                    new_hints.append(fifth_hint)
+        replacements[row] = new_hints
+
+    return replacements
+
+def main():
+    # Hold the bank lock from load to save so concurrent edits are not lost
+    with bank_lock(BACKEND_BANK):
+        # Load the questions file into columns instead of one dict per question
+        bank = ColumnarBank.load(BACKEND_BANK)
 
-            # Replace the hints
-            question['hints'] = new_hints
-            replaced_count += 1
-            print(f"Replaced hints for: {question['answer']}")
+        replacements = find_replacements(bank)
+        for row in replacements:
+            print(f"Replaced hints for: {bank.answers[row]}")
 
-    # Save the updated file
-    with open('/Users/mariana/code/loadsmile/hintman-game/backend/src/data/questions.json', 'w') as f:
-        json.dump(questions, f, indent=2, ensure_ascii=False)
+        # Replace all hints in one pass and save the updated file
+        bank.replace_hints(replacements)
+        bank.save(BACKEND_BANK, "replace_hints.py")
 
-    print(f"\nReplaced generic hints for {replaced_count} questions.")
+    print(f"\nReplaced generic hints for {len(replacements)} questions.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()